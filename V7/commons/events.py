@@ -18,12 +18,11 @@ during deliberation.
 """
 
 from __future__ import annotations
-from typing import Any, Awaitable, Callable, Dict, List, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from dataclasses import dataclass, field
 import asyncio
 import logging
-import traceback
-import uuid
+import secrets
 import time
 
 logger = logging.getLogger("eleanor.events")
@@ -33,22 +32,23 @@ logger = logging.getLogger("eleanor.events")
 # Event Schema
 # ---------------------------------------------------------------------------
 
-class Event(BaseModel):
+@dataclass(slots=True)
+class Event:
     """
     A structured event dispatched across Eleanor subsystems.
 
     Fields:
-        id: Unique event ID
+        id: Unique event ID (assigned on dispatch, only if someone listens)
         name: Event type string
         timestamp: Unix timestamp
         payload: Event-specific data
         metadata: Optional headers (actor, request_id, etc.)
     """
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     name: str
-    timestamp: float = Field(default_factory=time.time)
-    payload: Dict[str, Any] = Field(default_factory=dict)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    payload: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    id: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
 
 
 # ---------------------------------------------------------------------------
@@ -68,23 +68,43 @@ class EventBus:
       • broadcast(event)
 
     All listeners are isolated; one crashing never prevents others from running.
+
+    Listener sets are stored as immutable tuples and the mapping is rebuilt
+    copy-on-write on subscribe, so the emit path reads a stable snapshot.
+    The rebind is a single assignment on the loop thread, so no lock is
+    needed on either side.
+
+    When more than `max_parallel` listeners are attached to one event, their
+    execution is gated by a shared semaphore so bursts cannot fan out without
+    bound.
     """
 
-    def __init__(self):
-        self._listeners: Dict[str, List[Listener]] = {}
-        self._lock = asyncio.Lock()
+    def __init__(self, max_parallel: int = 32):
+        self._listeners: Dict[str, Tuple[Listener, ...]] = {}
+        self._max_parallel = max_parallel
+        # (loop, semaphore): created on first use and replaced when the
+        # running loop changes, since asyncio semaphores bind to the loop
+        # that first contends for them.
+        self._gate: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
 
     # ----------------------------------------------------------------------
 
-    async def subscribe(self, event_name: str, listener: Listener) -> None:
+    def has_listeners(self, event_name: str) -> bool:
+        """
+        Cheap check callers can use to skip building payloads nobody reads.
+        """
+        return event_name in self._listeners
+
+    # ----------------------------------------------------------------------
+
+    def subscribe(self, event_name: str, listener: Listener) -> None:
         """
         Register a listener callback for a given event.
         """
-        async with self._lock:
-            if event_name not in self._listeners:
-                self._listeners[event_name] = []
-            self._listeners[event_name].append(listener)
-        logger.debug(f"[EventBus] Subscribed listener to '{event_name}'")
+        current = self._listeners.get(event_name, ())
+        self._listeners = {**self._listeners, event_name: current + (listener,)}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[EventBus] Subscribed listener to '{event_name}'")
 
     # ----------------------------------------------------------------------
 
@@ -111,21 +131,49 @@ class EventBus:
         """
         Dispatch a pre-constructed event to all listeners.
         """
-        listeners = self._listeners.get(event.name, [])
+        listeners = self._listeners.get(event.name)
         if not listeners:
-            logger.debug(f"[EventBus] No listeners for event '{event.name}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[EventBus] No listeners for event '{event.name}'")
+            return
+
+        if event.id is None:
+            event.id = secrets.token_hex(16)
+
+        if len(listeners) == 1:
+            await self._safe_invoke(listeners[0], event)
             return
 
-        logger.debug(
-            f"[EventBus] Broadcasting '{event.name}' → {len(listeners)} listeners"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[EventBus] Broadcasting '{event.name}' → {len(listeners)} listeners"
+            )
+
+        invoke = (
+            self._gated_invoke
+            if len(listeners) > self._max_parallel
+            else self._safe_invoke
+        )
+        await asyncio.gather(
+            *(invoke(fn, event) for fn in listeners),
+            return_exceptions=True,
         )
 
-        tasks = []
-        for listener in listeners:
-            tasks.append(asyncio.create_task(self._safe_invoke(listener, event)))
+    # ----------------------------------------------------------------------
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+    def _get_gate(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        gate = self._gate
+        if gate is None or gate[0] is not loop:
+            gate = self._gate = (loop, asyncio.Semaphore(self._max_parallel))
+        return gate[1]
+
+    # ----------------------------------------------------------------------
+
+    async def _gated_invoke(self, listener: Listener, event: Event) -> Listener:
+        async with self._get_gate():
+            await self._safe_invoke(listener, event)
+        return listener
 
     # ----------------------------------------------------------------------
 
@@ -136,20 +184,18 @@ class EventBus:
         try:
             await listener(event)
         except Exception as exc:
-            logger.error(
-                f"[EventBus] Listener error in '{event.name}': {exc}\n{traceback.format_exc()}"
-            )
+            logger.exception("[EventBus] Listener error in '%s': %s", event.name, exc)
 
 
 # ---------------------------------------------------------------------------
 # Singleton access
 # ---------------------------------------------------------------------------
 
-_event_bus = EventBus()
+bus: EventBus = EventBus()
 
 
-async def get_bus() -> EventBus:
-    return _event_bus
+def get_bus() -> EventBus:
+    return bus
 
 
 # ---------------------------------------------------------------------------
@@ -166,6 +212,6 @@ def listener(event_name: str):
             ...
     """
     def decorator(fn: Listener):
-        asyncio.create_task(_event_bus.subscribe(event_name, fn))
+        bus.subscribe(event_name, fn)
         return fn
     return decorator
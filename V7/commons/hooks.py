@@ -15,53 +15,91 @@ Provides lifecycle hooks around all major Eleanor operations:
 
 Hooks are async and non-blocking. Failures are isolated so they never crash
 the main deliberation path.
+
+Hook points are a closed set, addressed by the `HookName` IntEnum; the
+lowercase string names are still accepted for compatibility.
 """
 
 from __future__ import annotations
-from typing import Any, Awaitable, Callable, Dict, List
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
 import asyncio
 import logging
-import traceback
 
 logger = logging.getLogger("eleanor.hooks")
 
 Hook = Callable[[Dict[str, Any]], Awaitable[None]]
 
 
+class HookName(IntEnum):
+    BEFORE_ROUTER = 0
+    AFTER_ROUTER = 1
+    BEFORE_CRITIC = 2
+    AFTER_CRITIC = 3
+    BEFORE_FUSION = 4
+    AFTER_FUSION = 5
+    BEFORE_RUNTIME_STEP = 6
+    AFTER_RUNTIME_STEP = 7
+
+
+def _resolve(hook_name: Union[HookName, str]) -> int:
+    if isinstance(hook_name, int):
+        return hook_name
+    try:
+        return HookName[hook_name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown hook: {hook_name}")
+
+
 class HookManager:
-    def __init__(self):
-        self._hooks: Dict[str, List[Hook]] = {
-            "before_router": [],
-            "after_router": [],
-            "before_critic": [],
-            "after_critic": [],
-            "before_fusion": [],
-            "after_fusion": [],
-            "before_runtime_step": [],
-            "after_runtime_step": [],
-        }
-        self._lock = asyncio.Lock()
+    def __init__(self, max_parallel: int = 32):
+        self._hooks: Tuple[Tuple[Hook, ...], ...] = tuple(() for _ in HookName)
+        self._max_parallel = max_parallel
+        # (loop, semaphore), rebuilt per running loop as in EventBus.
+        self._gate: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
 
     # ------------------------------------------------------------------
 
-    async def register(self, hook_name: str, fn: Hook) -> None:
-        async with self._lock:
-            if hook_name not in self._hooks:
-                raise ValueError(f"Unknown hook: {hook_name}")
-            self._hooks[hook_name].append(fn)
-        logger.debug(f"[Hooks] Registered hook → {hook_name}")
+    def register(self, hook_name: Union[HookName, str], fn: Hook) -> None:
+        idx = _resolve(hook_name)
+        # Copy-on-write: in-flight fire() calls keep iterating their snapshot.
+        hooks = list(self._hooks)
+        hooks[idx] = hooks[idx] + (fn,)
+        self._hooks = tuple(hooks)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[Hooks] Registered hook → {hook_name}")
 
     # ------------------------------------------------------------------
 
-    async def fire(self, hook_name: str, context: Dict[str, Any]) -> None:
-        hooks = self._hooks.get(hook_name, [])
+    async def fire(self, hook_name: Union[HookName, str], context: Dict[str, Any]) -> None:
+        hooks = self._hooks[_resolve(hook_name)]
         if not hooks:
             return
 
-        tasks = []
-        for fn in hooks:
-            tasks.append(asyncio.create_task(self._safe(fn, context)))
-        await asyncio.gather(*tasks, return_exceptions=True)
+        if len(hooks) == 1:
+            await self._safe(hooks[0], context)
+            return
+
+        invoke = self._gated if len(hooks) > self._max_parallel else self._safe
+        await asyncio.gather(
+            *(invoke(fn, context) for fn in hooks),
+            return_exceptions=True,
+        )
+
+    # ------------------------------------------------------------------
+
+    def _get_gate(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        gate = self._gate
+        if gate is None or gate[0] is not loop:
+            gate = self._gate = (loop, asyncio.Semaphore(self._max_parallel))
+        return gate[1]
+
+    # ------------------------------------------------------------------
+
+    async def _gated(self, fn: Hook, ctx: Dict[str, Any]):
+        async with self._get_gate():
+            await self._safe(fn, ctx)
 
     # ------------------------------------------------------------------
 
@@ -69,9 +107,7 @@ class HookManager:
         try:
             await fn(ctx)
         except Exception as exc:
-            logger.error(
-                f"[Hooks] Error in hook '{fn}': {exc}\n{traceback.format_exc()}"
-            )
+            logger.exception("[Hooks] Error in hook '%s': %s", fn, exc)
 
 
 # Singleton
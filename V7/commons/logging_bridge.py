@@ -10,19 +10,35 @@ Works seamlessly with the runtime, router, critics, and fusion engine.
 """
 
 from __future__ import annotations
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 import logging
 import json
+import queue
 import time
 import asyncio
 
-from .events import get_bus
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .events import bus, logger as _bus_logger
+
+LOG_EVENT = "log.batch"
+
+
+if orjson is not None:
+    def _dumps(data: Dict[str, Any]) -> str:
+        return orjson.dumps(data, default=str).decode()
+else:
+    def _dumps(data: Dict[str, Any]) -> str:
+        return json.dumps(data, default=str)
 
 
 class JsonLogFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         data = {
-            "timestamp": time.time(),
+            "timestamp": record.created,
             "level": record.levelname,
             "message": record.getMessage(),
             "module": record.module,
@@ -31,32 +47,106 @@ class JsonLogFormatter(logging.Formatter):
         }
         if record.exc_info:
             data["exception"] = self.formatException(record.exc_info)
-        return json.dumps(data)
+        return _dumps(data)
 
 
 class EventLogHandler(logging.Handler):
     """
     Sends all logs into the EventBus for consumption by dashboards, console
     loggers, or distributed observability.
+
+    `emit` only enqueues onto a thread-safe queue and wakes a background
+    asyncio task, which drains it and publishes records in `log.batch` events.
+    Records are dropped at enqueue while nobody subscribes to `log.batch`, and
+    records from the EventBus's own logger are not bridged.
     """
 
+    BATCH_SIZE = 256
+
     def __init__(self):
         super().__init__()
+        self._q: "queue.SimpleQueue[Dict[str, Any]]" = queue.SimpleQueue()
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
 
     def emit(self, record: logging.LogRecord):
+        # The bus logs about its own dispatch; bridging those records would
+        # feed every log.batch back into the next one.
+        if record.name == _bus_logger.name:
+            return
+        if not bus.has_listeners(LOG_EVENT):
+            return
         try:
-            payload = {
+            self._q.put_nowait({
                 "level": record.levelname,
                 "message": record.getMessage(),
                 "timestamp": time.time(),
                 "logger": record.name,
-            }
-            asyncio.create_task(
-                (await get_bus()).emit("log.record", payload=payload)
-            )
+            })
+            if self._task is None or self._task.done():
+                self.start()
+            else:
+                self._wake()
         except Exception:
             pass  # Never break logging
 
+    def _wake(self) -> None:
+        wakeup = self._wakeup
+        if wakeup is None or wakeup.is_set():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            wakeup.set()
+        else:
+            # asyncio.Event is not thread-safe; records logged from other
+            # threads hand the wakeup to the drain task's loop.
+            self._loop.call_soon_threadsafe(wakeup.set)
+
+    def start(self) -> Optional[asyncio.Task]:
+        """
+        Start the drain task on the running loop. Returns None when called
+        outside a loop; the next record logged from inside one starts it.
+        """
+        if self._task is not None and not self._task.done():
+            return self._task
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        # Drain whatever was queued before the task existed.
+        self._wakeup.set()
+        self._task = loop.create_task(self._pump(self._wakeup))
+        return self._task
+
+    async def _pump(self, wakeup: asyncio.Event):
+        while True:
+            await wakeup.wait()
+            # Clear before draining so a record enqueued mid-drain sets it
+            # again instead of waiting for the next one.
+            wakeup.clear()
+            while True:
+                items = _drain_queue_nowait_up_to(self._q, self.BATCH_SIZE)
+                if not items:
+                    break
+                if bus.has_listeners(LOG_EVENT):
+                    await bus.emit(LOG_EVENT, payload={"records": items})
+
+
+def _drain_queue_nowait_up_to(q: queue.SimpleQueue, limit: int) -> List[Any]:
+    items: List[Any] = []
+    while len(items) < limit:
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            break
+    return items
+
 
 def init_logging():
     handler = logging.StreamHandler()
@@ -67,4 +157,6 @@ def init_logging():
     root.addHandler(handler)
 
     # EventLogHandler is optional but recommended
-    root.addHandler(EventLogHandler())
+    event_handler = EventLogHandler()
+    root.addHandler(event_handler)
+    event_handler.start()
@@ -14,29 +14,37 @@ Allows dynamic discovery by name or type.
 Used throughout the orchestrator and runtime.
 """
 
-from typing import Any, Callable, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping
 import logging
 
 logger = logging.getLogger("eleanor.registry")
 
 
 class Registry:
+    __slots__ = ("_items", "_view")
+
     def __init__(self):
         self._items: Dict[str, Any] = {}
+        self._view: Mapping[str, Any] = MappingProxyType(self._items)
 
     def register(self, name: str, item: Any):
         if name in self._items:
             logger.warning(f"[Registry] Overwriting existing item: {name}")
         self._items[name] = item
-        logger.debug(f"[Registry] Registered item '{name}' → {item}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[Registry] Registered item '{name}' → {item}")
 
     def get(self, name: str) -> Any:
         if name not in self._items:
             raise KeyError(f"Registry has no item named '{name}'")
         return self._items[name]
 
-    def all(self) -> Dict[str, Any]:
-        return dict(self._items)
+    def all(self) -> Mapping[str, Any]:
+        """
+        Read-only live view of registered items (no copy).
+        """
+        return self._view
 
 
 # Singleton registry
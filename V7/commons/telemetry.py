@@ -7,6 +7,7 @@ Centralized telemetry utilities.
 
 Provides:
   • start_span / end_span
+  • traced (async context manager around a span)
   • emit_metric
   • emit_trace
   • critic timing capture
@@ -14,52 +15,163 @@ Provides:
 
 Telemetry is emitted using the EventBus so all downstream systems
 (analytics, debugging, dashboards) can subscribe.
+
+Emission is fire-and-forget: helpers enqueue onto a bounded in-process
+queue and return immediately. A single background task drains the queue
+and broadcasts queued items as one `telemetry.batch` event, so listener
+fan-out never sits on the deliberation path. When the queue is full, new
+items are dropped and counted rather than applying backpressure. Nothing
+is queued at all while no one is subscribed to `telemetry.batch`.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
 import time
-import uuid
+import secrets
 import logging
 import asyncio
 
-from .events import get_bus
+from .events import Event, bus
 
 logger = logging.getLogger("eleanor.telemetry")
 
+TELEMETRY_EVENT = "telemetry.batch"
+TELEMETRY_QUEUE_SIZE = 10000
+TELEMETRY_BATCH_SIZE = 256
+
+_dropped = 0
+
+
+class Span(NamedTuple):
+    span_id: str
+    name: str
+    start: float
+    context: Dict[str, Any]
+
+
+# ---------------------------------------------------------------------------
+# Queue plumbing
+# ---------------------------------------------------------------------------
+
+class _QueueState:
+    """
+    Queue and drain task for one event loop. asyncio queues bind to the
+    loop that first waits on them, so a new state is built whenever the
+    running loop changes (e.g. successive asyncio.run() calls).
+    """
+    __slots__ = ("loop", "queue", "task")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.queue: "asyncio.Queue[Tuple[str, Dict[str, Any]]]" = asyncio.Queue(
+            maxsize=TELEMETRY_QUEUE_SIZE
+        )
+        self.task: Optional[asyncio.Task] = None
+
+
+_state: Optional[_QueueState] = None
+
+
+def _get_state() -> _QueueState:
+    global _state
+    loop = asyncio.get_running_loop()
+    state = _state
+    if state is None or state.loop is not loop:
+        state = _state = _QueueState(loop)
+    if state.task is None or state.task.done():
+        state.task = loop.create_task(_drain_loop(state.queue))
+    return state
+
+
+def _enqueue(name: str, payload: Dict[str, Any]) -> None:
+    global _dropped
+    if not bus.has_listeners(TELEMETRY_EVENT):
+        return
+    try:
+        _get_state().queue.put_nowait((name, payload))
+    except asyncio.QueueFull:
+        _dropped += 1
+
+
+async def _drain_loop(
+    q: "asyncio.Queue[Tuple[str, Dict[str, Any]]]",
+) -> None:
+    while True:
+        batch: List[Dict[str, Any]] = []
+        name, payload = await q.get()
+        batch.append({"name": name, "payload": payload})
+        while len(batch) < TELEMETRY_BATCH_SIZE:
+            try:
+                name, payload = q.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            batch.append({"name": name, "payload": payload})
+
+        try:
+            await bus.broadcast(
+                Event(name=TELEMETRY_EVENT, payload={"events": batch})
+            )
+        except Exception as exc:
+            logger.error(f"[Telemetry] Batch dispatch failed: {exc}")
+        finally:
+            for _ in batch:
+                q.task_done()
+
+
+def dropped_count() -> int:
+    """
+    Number of telemetry items discarded because the queue was full.
+    """
+    return _dropped
+
+
+async def flush() -> None:
+    """
+    Wait until every telemetry item queued on the running loop has been
+    dispatched.
+    """
+    state = _state
+    if state is None or state.loop is not asyncio.get_running_loop():
+        return
+    if state.task is not None and not state.task.done():
+        await state.queue.join()
+
+
+# ---------------------------------------------------------------------------
+# Public helpers
+# ---------------------------------------------------------------------------
 
 async def start_span(
     name: str, context: Optional[Dict[str, Any]] = None
-) -> Dict[str, Any]:
-    span_id = str(uuid.uuid4())
-    start_time = time.time()
+) -> Span:
+    span = Span(secrets.token_hex(16), name, time.time(), context or {})
 
-    await (await get_bus()).emit(
+    _enqueue(
         "telemetry.span.start",
-        payload={
-            "span_id": span_id,
+        {
+            "span_id": span.span_id,
             "name": name,
-            "context": context or {},
-            "timestamp": start_time,
+            "context": span.context,
+            "timestamp": span.start,
         },
     )
 
-    return {
-        "span_id": span_id,
-        "name": name,
-        "start": start_time,
-        "context": context or {},
-    }
+    return span
+
 
+async def end_span(span: Span, result: Optional[Any] = None):
+    # Stringifying the result can be expensive; skip it when unobserved.
+    if not bus.has_listeners(TELEMETRY_EVENT):
+        return
 
-async def end_span(span: Dict[str, Any], result: Optional[Any] = None):
-    duration = time.time() - span["start"]
+    duration = time.time() - span.start
 
-    await (await get_bus()).emit(
+    _enqueue(
         "telemetry.span.end",
-        payload={
-            "span_id": span["span_id"],
-            "name": span["name"],
+        {
+            "span_id": span.span_id,
+            "name": span.name,
             "duration": duration,
             "result_summary": str(result)[:500] if result else None,
         },
@@ -69,9 +181,9 @@ async def end_span(span: Dict[str, Any], result: Optional[Any] = None):
 async def emit_metric(
     name: str, value: float, tags: Optional[Dict[str, Any]] = None
 ):
-    await (await get_bus()).emit(
+    _enqueue(
         "telemetry.metric",
-        payload={
+        {
             "name": name,
             "value": value,
             "tags": tags or {},
@@ -80,10 +192,72 @@ async def emit_metric(
 
 
 async def emit_trace(message: str, details: Optional[Dict[str, Any]] = None):
-    await (await get_bus()).emit(
+    _enqueue(
         "telemetry.trace",
-        payload={
+        {
             "message": message,
             "details": details or {},
         },
     )
+
+
+class SpanScope:
+    """
+    Handle yielded by `traced`. Set `result` to control the span summary;
+    it defaults to "error" when the block raises.
+    """
+    __slots__ = ("span", "result")
+
+    def __init__(self, span: Span):
+        self.span = span
+        self.result: Optional[Any] = None
+
+
+@asynccontextmanager
+async def traced(
+    name: str, context: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[SpanScope]:
+    """
+    Open a span for the duration of the block and always close it.
+
+    Example:
+        async with traced("router.execute", ctx) as scope:
+            scope.result = await do_work()
+    """
+    scope = SpanScope(await start_span(name, context))
+    try:
+        yield scope
+    except BaseException:
+        if scope.result is None:
+            scope.result = "error"
+        raise
+    finally:
+        await end_span(scope.span, result=scope.result)
+
+
+# ---------------------------------------------------------------------------
+# Disabled telemetry
+# ---------------------------------------------------------------------------
+
+class _NullTraced:
+    """Async context manager matching `traced` that records nothing."""
+    __slots__ = ("scope",)
+
+    def __init__(self):
+        self.scope = SpanScope(None)
+
+    async def __aenter__(self) -> SpanScope:
+        return self.scope
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+
+def null_traced(
+    name: str, context: Optional[Dict[str, Any]] = None
+) -> _NullTraced:
+    return _NullTraced()
+
+
+async def null_trace(message: str, details: Optional[Dict[str, Any]] = None):
+    return None
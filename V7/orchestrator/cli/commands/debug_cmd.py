@@ -5,15 +5,15 @@ Debug mode — prints each stage of deliberation.
 """
 
 from __future__ import annotations
-import json
+import orjson
 from pathlib import Path
 
 async def cmd_debug(args):
-    data = json.loads(Path(args.input).read_text())
+    data = orjson.loads(Path(args.input).read_bytes())
     
     print("=== ELEANOR DEBUG MODE ===")
     print("Request:")
-    print(json.dumps(data, indent=2))
+    print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
     print("\n(Stub) Running critics...")
     print("rights → OK")
     print("risk → OK")
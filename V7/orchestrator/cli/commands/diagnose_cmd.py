@@ -5,14 +5,20 @@ Prints system info, health status, and critic readiness.
 """
 
 from __future__ import annotations
+from functools import lru_cache
 import platform
-import json
+import orjson
+
+@lru_cache(maxsize=1)
+def _platform_info():
+    return (platform.python_version(), platform.system(), platform.release())
 
 async def cmd_diagnose(args):
+    python_version, system, release = _platform_info()
     info = {
-        "python": platform.python_version(),
-        "system": platform.system(),
-        "release": platform.release(),
+        "python": python_version,
+        "system": system,
+        "release": release,
         "eleanor": {"version": "0.1.0", "status": "OK"},
         "critics": {
             "rights": "OK",
@@ -23,4 +29,4 @@ async def cmd_diagnose(args):
         },
     }
     
-    print(json.dumps(info, indent=2))
+    print(orjson.dumps(info, option=orjson.OPT_INDENT_2).decode())
@@ -6,7 +6,20 @@ Runs a folder of test cases through Eleanor and prints metrics.
 
 from __future__ import annotations
 from pathlib import Path
-import json
+import asyncio
+import orjson
+
+MAX_CONCURRENT_READS = 64
+
+async def _load_and_check(f: Path, sem: asyncio.Semaphore):
+    try:
+        async with sem:
+            raw = await asyncio.to_thread(f.read_bytes)
+        data = orjson.loads(raw)
+        # In real implementation: pass into runtime
+        return {"file": f.name, "status": "OK"}
+    except Exception as exc:
+        return {"file": f.name, "status": "ERROR", "error": str(exc)}
 
 async def cmd_evaluate(args):
     path = Path(args.path)
@@ -15,14 +28,7 @@ async def cmd_evaluate(args):
         return
     
     files = sorted(path.glob("*.json"))
-    results = []
-    
-    for f in files:
-        try:
-            data = json.loads(f.read_text())
-            # In real implementation: pass into runtime
-            results.append({"file": f.name, "status": "OK"})
-        except Exception as exc:
-            results.append({"file": f.name, "status": "ERROR", "error": str(exc)})
+    sem = asyncio.Semaphore(MAX_CONCURRENT_READS)
+    results = await asyncio.gather(*(_load_and_check(f, sem) for f in files))
     
-    print(json.dumps(results, indent=2))
+    print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
@@ -5,7 +5,7 @@ Runs a single request through Eleanor.
 """
 
 from __future__ import annotations
-import json
+import orjson
 from pathlib import Path
 from orchestrator.runtime.runtime_bootstrap import bootstrap_runtime
 from orchestrator.runtime.runtime_config import RuntimeConfig
@@ -13,7 +13,7 @@ from orchestrator.router.router import Router
 from orchestrator.router.router_config import RouterConfig
 
 async def cmd_run(args):
-    data = json.loads(Path(args.input).read_text())
+    data = orjson.loads(Path(args.input).read_bytes())
     
     # Load config
     cfg = None
@@ -42,7 +42,7 @@ async def cmd_run(args):
     runtime = await bootstrap_runtime(router, critics, storage_backend=None, config=cfg)
     result = await runtime.decide(data)
     
-    print(json.dumps(result, indent=2))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2, default=str).decode())
 
 # Fake critic used for CLI demonstration
 class FakeCritic:
@@ -8,7 +8,7 @@ Implements Eleanor's multi-critic aggregation logic:
 """
 
 from __future__ import annotations
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import logging
 from commons.telemetry import start_span, end_span
 
@@ -44,6 +44,10 @@ class CriticFusion:
     
     def __init__(self, weights: Dict[str, float] = None):
         self.weights = weights or self.DEFAULT_WEIGHTS
+        # Zero weights never contribute, so only iterate the live ones.
+        self._weight_items: Tuple[Tuple[str, float], ...] = tuple(
+            (k, v) for k, v in self.weights.items() if v != 0.0
+        )
     
     # ---------------------------------------------------------
     
@@ -51,10 +55,10 @@ class CriticFusion:
         span = await start_span("fusion.critics")
         
         # 1) Rights-based lexicographic block
-        lex_violations = []
-        for name, out in critics.items():
-            if name in self.RIGHTS_CRITICS and out.get("violation", False):
-                lex_violations.append(name)
+        lex_violations = [
+            name for name in self.RIGHTS_CRITICS
+            if critics.get(name, {}).get("violation", False)
+        ]
         
         if lex_violations:
             result = {
@@ -68,10 +72,10 @@ class CriticFusion:
         
         # 2) Weighted scoring
         total = 0.0
-        for name, out in critics.items():
-            w = self.weights.get(name, 0.0)
-            score = float(out.get("score", 0.0))
-            total += w * score
+        for name, w in self._weight_items:
+            out = critics.get(name)
+            if out is not None:
+                total += w * float(out.get("score", 0.0))
         
         result = {
             "aggregate_score": total,
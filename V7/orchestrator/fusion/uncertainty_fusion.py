@@ -21,7 +21,6 @@ Outputs:
 
 from __future__ import annotations
 from typing import Dict, Any
-import statistics
 from commons.telemetry import emit_metric
 
 class UncertaintyEngine:
@@ -31,18 +30,31 @@ class UncertaintyEngine:
     # ---------------------------------------------------------
     
     async def compute(self, critics: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
-        scores = []
-        confidences = []
-        
+        # Single pass: count, sum, sum of squares, min confidence
+        n = 0
+        s = 0.0
+        ss = 0.0
+        min_c = float("inf")
         for c in critics.values():
-            scores.append(float(c.get("score", 0.0)))
-            confidences.append(float(c.get("confidence", 0.0)))
+            score = float(c.get("score", 0.0))
+            conf = float(c.get("confidence", 0.0))
+            n += 1
+            s += score
+            ss += score * score
+            if conf < min_c:
+                min_c = conf
+        if not n:
+            min_c = 0.0
         
-        # Statistical disagreement
-        dispersion = statistics.pvariance(scores) if len(scores) > 1 else 0.0
+        # Statistical disagreement (population variance)
+        if n > 1:
+            mean = s / n
+            dispersion = max(0.0, ss / n - mean * mean)
+        else:
+            dispersion = 0.0
         
         # If any critic has low confidence, uncertainty rises
-        low_conf = min(confidences) < 0.3
+        low_conf = min_c < 0.3
         raw_uncertainty = min(1.0, dispersion * 2.5 + (0.3 if low_conf else 0.0))
         escalate = raw_uncertainty >= self.threshold
         
@@ -52,5 +64,5 @@ class UncertaintyEngine:
             "uncertainty": raw_uncertainty,
             "escalate": escalate,
             "dispersion": dispersion,
-            "min_confidence": min(confidences),
+            "min_confidence": min_c,
         }
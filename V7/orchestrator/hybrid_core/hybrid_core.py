@@ -12,29 +12,56 @@ result = await core.deliberate(input)
 """
 
 from __future__ import annotations
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import logging
 import asyncio
 
-from commons.telemetry import start_span, end_span, emit_trace
-from commons.events import get_bus
+from commons.telemetry import traced, emit_trace, null_traced, null_trace
 from .hybrid_modes import HybridMode, HybridModeConfig
 from .hybrid_exceptions import EscalationRequired, HybridCoreError
 
 logger = logging.getLogger("eleanor.hybridcore")
 
+# Mode flag bits, precomputed once per HybridCore
+_MF_ENFORCE_LEX = 1
+_MF_ADVISORY_ONLY = 2
+_MF_AUTO_ESCALATE = 4
+
 class HybridCore:
-    def __init__(self, router, critics: Dict[str, Any], fusion, mode: HybridModeConfig = HybridMode.BALANCED):
+    def __init__(self, router, critics: Dict[str, Any], fusion, mode: HybridModeConfig = HybridMode.BALANCED, telemetry: bool = True):
         """
         router: Router instance
         critics: dict of critic_name → critic_instance
         fusion: ConsensusFusion instance
         mode: HybridModeConfig
+        telemetry: emit spans/traces (RuntimeConfig.enable_telemetry)
         """
         self.router = router
         self.critics = critics
         self.fusion = fusion
         self.mode = mode
+        # Shared across deliberations so concurrent requests cannot
+        # oversubscribe remote critic endpoints. Held as (loop, semaphore)
+        # and rebuilt per running loop, as the semaphore binds to the loop
+        # that first contends for it.
+        self._critic_limit = mode.critic_concurrency or 8
+        self._critic_sem: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+        self._mf = (
+            (_MF_ENFORCE_LEX if mode.enforce_lex else 0)
+            | (_MF_ADVISORY_ONLY if mode.advisory_only else 0)
+            | (_MF_AUTO_ESCALATE if mode.auto_escalate else 0)
+        )
+        self._traced = traced if telemetry else null_traced
+        self._emit_trace = emit_trace if telemetry else null_trace
+    
+    # ----------------------------------------------------------------------
+    
+    def _get_critic_sem(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        sem = self._critic_sem
+        if sem is None or sem[0] is not loop:
+            sem = self._critic_sem = (loop, asyncio.Semaphore(self._critic_limit))
+        return sem[1]
     
     # ----------------------------------------------------------------------
     
@@ -49,44 +76,43 @@ class HybridCore:
         4. fuse results
         5. apply mode logic
         """
-        span = await start_span("hybrid.deliberate")
-        try:
-            # ------------------------------
-            # Step 1 — router executes model
-            # ------------------------------
-            backend_result = await self.router.execute(
-                request,
-                backend_runner=self._backend_runner,
-                context=request,
-            )
-            
-            # ------------------------------
-            # Step 2 — run critics in parallel
-            # ------------------------------
-            critics_out = await self._evaluate_critics(request, backend_result)
-            
-            # ------------------------------
-            # Step 3 — fusion
-            # ------------------------------
-            vector = backend_result.get("embedding")  # optional
-            fusion_out = await self.fusion.decide(critics_out, vector=vector)
-            
-            # ------------------------------
-            # Step 4 — hybrid mode logic
-            # ------------------------------
-            decision = await self._apply_mode(fusion_out)
+        async with self._traced("hybrid.deliberate") as scope:
+            try:
+                # ------------------------------
+                # Step 1 — router executes model
+                # ------------------------------
+                backend_result = await self.router.execute(
+                    request,
+                    backend_runner=self._backend_runner,
+                    context=request,
+                )
+                
+                # ------------------------------
+                # Step 2 — run critics in parallel
+                # ------------------------------
+                critics_out = await self._evaluate_critics(request, backend_result)
+                
+                # ------------------------------
+                # Step 3 — fusion
+                # ------------------------------
+                vector = backend_result.get("embedding")  # optional
+                fusion_out = await self.fusion.decide(critics_out, vector=vector)
+                
+                # ------------------------------
+                # Step 4 — hybrid mode logic
+                # ------------------------------
+                decision = self._apply_mode(fusion_out)
+                
+                scope.result = decision
+                return decision
             
-            await end_span(span, result=decision)
-            return decision
-        
-        except EscalationRequired:
-            await emit_trace("hybrid.escalation_forced", {"request": request})
-            await end_span(span, result="escalation_required")
-            raise
-        except Exception as exc:
-            await emit_trace("hybrid.error", {"error": str(exc)})
-            await end_span(span, result="error")
-            raise HybridCoreError(str(exc))
+            except EscalationRequired:
+                scope.result = "escalation_required"
+                await self._emit_trace("hybrid.escalation_forced", {"request": request})
+                raise
+            except Exception as exc:
+                await self._emit_trace("hybrid.error", {"error": str(exc)})
+                raise HybridCoreError(str(exc))
     
     # ----------------------------------------------------------------------
     
@@ -104,54 +130,57 @@ class HybridCore:
     
     async def _evaluate_critics(self, request, backend_response):
         """
-        Run all critics concurrently.
+        Run all critics concurrently, bounded by the mode's critic_concurrency.
         """
-        tasks = {
-            name: asyncio.create_task(critic.evaluate(request, backend_response))
-            for name, critic in self.critics.items()
-        }
-        
-        results = {}
-        for name, task in tasks.items():
+        async def _run_one(name, critic):
+            # Errors are handled per critic so one failure never cancels
+            # the rest of the TaskGroup.
             try:
-                results[name] = await task
+                async with self._get_critic_sem():
+                    return await critic.evaluate(request, backend_response)
             except Exception as exc:
                 logger.warning(f"[HybridCore] Critic '{name}' failed: {exc}")
-                results[name] = {
+                return {
                     "score": 0,
                     "confidence": 0,
                     "violation": False,
                     "rationale": f"Critic error: {exc}",
                 }
         
-        return results
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                name: tg.create_task(_run_one(name, critic))
+                for name, critic in self.critics.items()
+            }
+        
+        return {name: task.result() for name, task in tasks.items()}
     
     # ----------------------------------------------------------------------
     
-    async def _apply_mode(self, fusion_out: Dict[str, Any]) -> Dict[str, Any]:
+    def _apply_mode(self, fusion_out: Dict[str, Any]) -> Dict[str, Any]:
         """
         Governs how the system treats the fusion result.
         """
+        mf = self._mf
+        
         # Lex block → always block
-        if fusion_out.get("lex_block", False):
-            if self.mode.enforce_lex:
-                return {
-                    "action": "reject",
-                    "reason": "rights_violation",
-                    "fusion": fusion_out,
-                }
+        if mf & _MF_ENFORCE_LEX and fusion_out.get("lex_block", False):
+            return {
+                "action": "reject",
+                "reason": "rights_violation",
+                "fusion": fusion_out,
+            }
         
         # Advisory mode → never block or escalate
-        if self.mode.advisory_only:
+        if mf & _MF_ADVISORY_ONLY:
             return {
                 "action": "advice",
                 "fusion": fusion_out,
             }
         
         # Escalation trigger
-        if fusion_out["action"] == "escalate":
-            if self.mode.auto_escalate:
-                raise EscalationRequired("Uncertainty threshold exceeded.")
+        if mf & _MF_AUTO_ESCALATE and fusion_out["action"] == "escalate":
+            raise EscalationRequired("Uncertainty threshold exceeded.")
         
         # Otherwise return normal fusion decision
         return fusion_out
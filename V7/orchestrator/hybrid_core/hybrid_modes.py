@@ -8,10 +8,12 @@ Each mode determines:
 • uncertainty thresholds
 • whether escalation is allowed or required
 • whether blocking actions are permitted
+• how many critic evaluations may run at once
 """
 
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import Dict
 
 @dataclass
 class HybridModeConfig:
@@ -22,6 +24,7 @@ class HybridModeConfig:
     uncertainty_threshold: float = 0.35
     block_on_violation: bool = True
     advisory_only: bool = False
+    critic_concurrency: int = 8
 
 class HybridMode:
     """
@@ -88,19 +91,23 @@ class HybridMode:
         advisory_only=False,
     )
     
+    _MODES: Dict[str, HybridModeConfig] = {}
+    
     @classmethod
     def get(cls, mode: str) -> HybridModeConfig:
-        mode = mode.lower()
-        if mode == "strict":
-            return cls.STRICT
-        if mode == "balanced":
-            return cls.BALANCED
-        if mode == "permissive":
-            return cls.PERMISSIVE
-        if mode == "advisory":
-            return cls.ADVISORY
-        if mode == "appliance":
-            return cls.APPLIANCE
-        if mode == "distributed":
-            return cls.DISTRIBUTED
-        raise ValueError(f"Unknown hybrid mode '{mode}'")
+        try:
+            return cls._MODES[mode.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown hybrid mode '{mode.lower()}'") from None
+
+HybridMode._MODES = {
+    m.name: m
+    for m in (
+        HybridMode.STRICT,
+        HybridMode.BALANCED,
+        HybridMode.PERMISSIVE,
+        HybridMode.ADVISORY,
+        HybridMode.APPLIANCE,
+        HybridMode.DISTRIBUTED,
+    )
+}
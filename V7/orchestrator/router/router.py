@@ -17,30 +17,39 @@ from __future__ import annotations
 from typing import Any, Dict, Optional
 import asyncio
 import logging
-import traceback
+import random
 
-from commons.telemetry import start_span, end_span, emit_trace
-from commons.events import get_bus
+from commons.telemetry import traced, emit_trace, null_traced, null_trace
 
 from .router_config import RouterConfig
-from .router_rules import evaluate_rules
+from .router_rules import evaluate_compiled
 from .router_exceptions import RouterError, NoModelAvailable
 
 logger = logging.getLogger("eleanor.router")
 
 
 class Router:
-    def __init__(self, config: RouterConfig):
+    def __init__(self, config: RouterConfig, telemetry: bool = True):
         self.config = config
         self.models = config.models
+        self._backend_cache: Dict[str, Any] = {}
+        self.set_telemetry(telemetry)
+
+    def set_telemetry(self, enabled: bool):
+        """
+        Bind real or no-op telemetry calls. Routers are usually built
+        before the RuntimeConfig is known, so bootstrap calls this.
+        """
+        self._traced = traced if enabled else null_traced
+        self._emit_trace = emit_trace if enabled else null_trace
 
     # ------------------------------------------------------------------
 
-    async def route(self, request: Dict[str, Any]) -> str:
+    def route(self, request: Dict[str, Any]) -> str:
         """
         Determine the backend model to use.
         """
-        model = evaluate_rules(self.config.routing_rules, request)
+        model = evaluate_compiled(self.config.compiled_rules, request)
         if model:
             return model
         # default fallback
@@ -59,52 +68,68 @@ class Router:
 
         backend_runner(model_name, request) must be provided externally.
         """
-        span = await start_span("router.execute", context)
-
-        try:
-            model = await self.route(request)
-            cfg = self.config.get_backend(model)
+        async with self._traced("router.execute", context) as scope:
+            try:
+                model = self.route(request)
+                cfg = self._backend_cache.get(model)
+                if cfg is None:
+                    cfg = self._backend_cache[model] = self.config.get_backend(model)
 
-            if not cfg.enabled:
-                raise NoModelAvailable(f"Model '{model}' is disabled")
+                if not cfg.enabled:
+                    raise NoModelAvailable(f"Model '{model}' is disabled")
 
-            response = await self._run_backend(cfg, backend_runner, request)
-            await end_span(span, result=response)
-            return response
+                response = await self._run_backend(cfg, backend_runner, request)
+                scope.result = response
+                return response
 
-        except NoModelAvailable:
-            await emit_trace("router.no_model_available", {"request": request})
-            await end_span(span, result="fallback_no_model")
-            raise
+            except NoModelAvailable:
+                scope.result = "fallback_no_model"
+                await self._emit_trace("router.no_model_available", {"request": request})
+                raise
 
-        except Exception as exc:
-            logger.error(
-                f"[Router] Execution failed: {exc}\n{traceback.format_exc()}"
-            )
-            await emit_trace("router.error", {"error": str(exc)})
-            await end_span(span, result="error")
-            raise RouterError(str(exc))
+            except Exception as exc:
+                # The traceback is only rendered when DEBUG is enabled.
+                logger.error(
+                    "[Router] Execution failed: %s",
+                    exc,
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
+                )
+                await self._emit_trace("router.error", {"error": str(exc)})
+                raise RouterError(str(exc))
 
     # ------------------------------------------------------------------
 
     async def _run_backend(self, cfg, runner, request):
         """
         Run the backend with timeouts + retry logic.
+
+        Failed attempts back off exponentially (capped at the backend
+        timeout) with random jitter, and a single trace is emitted once all
+        attempts are exhausted.
+
+        Each attempt is limited to cfg.timeout and all attempts share one
+        overall deadline of cfg.timeout * (max_retries + 1).
         """
         last_exc = None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + cfg.timeout * (cfg.max_retries + 1)
 
-        for _ in range(cfg.max_retries + 1):
+        for i in range(cfg.max_retries + 1):
             try:
-                return await asyncio.wait_for(
-                    runner(cfg.name, request),
-                    timeout=cfg.timeout,
-                )
+                async with asyncio.timeout_at(min(deadline, loop.time() + cfg.timeout)):
+                    return await runner(cfg.name, request)
             except Exception as exc:
                 last_exc = exc
-                await emit_trace(
-                    "router.backend_retry",
-                    {"backend": cfg.name, "error": str(exc)},
-                )
+                if i < cfg.max_retries and loop.time() < deadline:
+                    await asyncio.sleep(
+                        min(cfg.timeout, cfg.retry_base * (2 ** i))
+                        + random.random() * cfg.retry_jitter
+                    )
+
+        await self._emit_trace(
+            "router.backend_retry",
+            {"backend": cfg.name, "attempts": cfg.max_retries + 1, "error": str(last_exc)},
+        )
 
         raise RouterError(
             f"Backend '{cfg.name}' failed after {cfg.max_retries} retries: {last_exc}"
@@ -12,28 +12,102 @@ Defines RouterConfig, which controls:
 """
 
 from __future__ import annotations
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, fields
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
+from .router_rules import CompiledRule, compile_rules
 
-class ModelBackendConfig(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class ModelBackendConfig:
+    """
+    Immutable per-backend settings. Read on every routed call, so this is
+    a plain slotted dataclass; validation happens once in from_dict().
+    """
     name: str
     endpoint: str
     timeout: float = 10.0
     max_retries: int = 1
+    retry_base: float = 0.05
+    retry_jitter: float = 0.05
     enabled: bool = True
 
+    @classmethod
+    def from_dict(cls, data: Any) -> "ModelBackendConfig":
+        if isinstance(data, cls):
+            return data
+        try:
+            return cls(**{
+                k: _BACKEND_FIELD_TYPES[k](v)
+                for k, v in data.items()
+                if k in _BACKEND_FIELD_TYPES
+            })
+        except (AttributeError, TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid model backend config: {exc}") from None
+
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes"})
+_FALSE_STRINGS = frozenset({"false", "0", "no"})
+
+
+def _parse_bool(value: Any) -> bool:
+    # bool("false") is True, so env/YAML strings are parsed explicitly.
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"expected a boolean, got {value!r}")
+
+
+def _parse_str(value: Any) -> str:
+    # str(None) is "None", so a null endpoint must not pass as a string.
+    if isinstance(value, str):
+        return value
+    raise ValueError(f"expected a string, got {value!r}")
+
+
+_BACKEND_FIELD_TYPES = {
+    f.name: {"str": _parse_str, "float": float, "int": int, "bool": _parse_bool}[f.type]
+    for f in fields(ModelBackendConfig)
+}
+
 
 class RouterConfig(BaseModel):
     default_model: str
-    models: Dict[str, ModelBackendConfig]
+    # Typed as Any: pydantic v1 would re-validate the dataclass values and
+    # cannot handle __slots__. _build_backends yields ModelBackendConfig.
+    models: Dict[str, Any]
     routing_rules: List[Dict[str, Any]] = Field(default_factory=list)
 
+    _compiled: Tuple[CompiledRule, ...] = PrivateAttr(default=())
+
+    @validator("models", pre=True)
+    def _build_backends(cls, v):
+        if not isinstance(v, dict):
+            raise ValueError(f"models must be a mapping, got {type(v).__name__}")
+        return {k: ModelBackendConfig.from_dict(b) for k, b in v.items()}
+
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+        self._compiled = compile_rules(self.routing_rules)
+
+    @property
+    def compiled_rules(self) -> Tuple[CompiledRule, ...]:
+        return self._compiled
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]):
         return cls(**data)
 
     def get_backend(self, name: str) -> ModelBackendConfig:
-        if name not in self.models:
-            raise KeyError(f"Unknown model backend: {name}")
-        return self.models[name]
+        try:
+            return self.models[name]
+        except KeyError:
+            raise KeyError(f"Unknown model backend: {name}") from None
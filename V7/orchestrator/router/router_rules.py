@@ -10,12 +10,18 @@ Rule format (example):
     "if": {"task": "summarize"},
     "use_model": "gpt-4"
   }
+
+Rules are normally compiled once (see compile_rules) into predicate
+closures so per-request routing does no rule interpretation.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 from .router_exceptions import RoutingRuleError
 
+# (predicate, model_name, source_rule)
+CompiledRule = Tuple[Callable[[Dict[str, Any]], bool], Optional[str], Dict[str, Any]]
+
 
 def rule_matches(rule: Dict[str, Any], request: Dict[str, Any]) -> bool:
     """
@@ -43,3 +49,42 @@ def evaluate_rules(rules: list, request: Dict[str, Any]) -> Optional[str]:
         except Exception as exc:
             raise RoutingRuleError(f"Error evaluating rule {rule}: {exc}")
     return None
+
+
+def compile_rules(rules: list) -> Tuple[CompiledRule, ...]:
+    """
+    Partially evaluate a rule list into (predicate, model, rule) tuples.
+    Rules without an "if" condition never match and are dropped.
+    """
+    compiled = []
+    for rule in rules:
+        try:
+            cond = rule.get("if", {})
+            if not cond:
+                continue
+            items = tuple(cond.items())
+            model = rule.get("use_model")
+        except Exception as exc:
+            raise RoutingRuleError(f"Error compiling rule {rule}: {exc}")
+
+        def predicate(request: Dict[str, Any], items=items) -> bool:
+            for key, value in items:
+                if request.get(key) != value:
+                    return False
+            return True
+
+        compiled.append((predicate, model, rule))
+    return tuple(compiled)
+
+
+def evaluate_compiled(compiled: Tuple[CompiledRule, ...], request: Dict[str, Any]) -> Optional[str]:
+    """
+    Return the model selected by the first matching compiled rule.
+    """
+    for predicate, model, rule in compiled:
+        try:
+            if predicate(request):
+                return model
+        except Exception as exc:
+            raise RoutingRuleError(f"Error evaluating rule {rule}: {exc}")
+    return None
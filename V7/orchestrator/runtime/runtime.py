@@ -16,9 +16,9 @@ from typing import Dict, Any, Optional
 import asyncio
 import logging
 
-from commons.events import get_bus
-from commons.hooks import get_hooks
-from commons.telemetry import start_span, end_span, emit_trace
+from commons.events import bus
+from commons.hooks import HookName, get_hooks
+from commons.telemetry import traced, emit_trace, null_traced, null_trace
 from .runtime_state import RuntimeState
 from .runtime_config import RuntimeConfig
 from ..hybrid_core.hybrid_exceptions import EscalationRequired
@@ -31,6 +31,9 @@ class EleanorRuntime:
         self.config = config
         self.state = RuntimeState()
         self.semaphore = asyncio.Semaphore(config.max_concurrent_tasks)
+        # Resolved once so the hot path never checks the flag.
+        self._traced = traced if config.enable_telemetry else null_traced
+        self._emit_trace = emit_trace if config.enable_telemetry else null_trace
     
     # ------------------------------------------------------------------
     
@@ -43,14 +46,11 @@ class EleanorRuntime:
         self.state.log_request(req_id, request)
         
         hooks = await get_hooks()
-        bus = await get_bus()
         
         await bus.emit("runtime.request.received", {"id": req_id, "request": request})
-        await hooks.fire("before_runtime_step", {"id": req_id, "request": request})
+        await hooks.fire(HookName.BEFORE_RUNTIME_STEP, {"id": req_id, "request": request})
         
-        span = await start_span("runtime.decide", {"req_id": req_id})
-        
-        async with self.semaphore:
+        async with self._traced("runtime.decide", {"req_id": req_id}) as scope, self.semaphore:
             try:
                 self.state.increment_active()
                 
@@ -60,17 +60,17 @@ class EleanorRuntime:
                 )
                 
                 self.state.complete()
-                await hooks.fire("after_runtime_step", {"id": req_id, "result": result})
+                await hooks.fire(HookName.AFTER_RUNTIME_STEP, {"id": req_id, "result": result})
                 await bus.emit("runtime.request.completed", {"id": req_id, "result": result})
-                await end_span(span, result=result)
+                scope.result = result
                 
                 return result
             
             except EscalationRequired as exc:
                 self.state.fail()
-                await emit_trace("runtime.escalation", {"id": req_id})
+                await self._emit_trace("runtime.escalation", {"id": req_id})
                 await bus.emit("runtime.request.escalation", {"id": req_id})
-                await end_span(span, result="escalation_required")
+                scope.result = "escalation_required"
                 
                 return {
                     "action": "escalate",
@@ -81,9 +81,9 @@ class EleanorRuntime:
             except Exception as exc:
                 self.state.fail()
                 logger.error(f"[Runtime] Execution failed: {exc}")
-                await emit_trace("runtime.error", {"id": req_id, "error": str(exc)})
+                await self._emit_trace("runtime.error", {"id": req_id, "error": str(exc)})
                 await bus.emit("runtime.request.error", {"id": req_id, "error": str(exc)})
-                await end_span(span, result="error")
+                scope.result = "error"
                 
                 return {
                     "action": "error",
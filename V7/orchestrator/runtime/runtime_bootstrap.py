@@ -29,6 +29,7 @@ async def bootstrap_runtime(
     config: RuntimeConfig = None,
 ):
     config = config or RuntimeConfig()
+    router.set_telemetry(config.enable_telemetry)
     
     # fusion stack
     critic_fusion = CriticFusion()
@@ -46,6 +47,7 @@ async def bootstrap_runtime(
         critics=critics,
         fusion=fusion,
         mode=HybridMode.get(config.mode),
+        telemetry=config.enable_telemetry,
     )
     
     runtime = EleanorRuntime(
@@ -6,37 +6,63 @@ and other execution metadata.
 """
 
 from __future__ import annotations
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Any
 import time
 import uuid
 
+# Oldest request_log entries are evicted beyond this many
+MAX_REQUEST_LOG = 10_000
+
+# Slots in the packed counter array
+_ACTIVE = 0
+_COMPLETED = 1
+_FAILED = 2
+
 @dataclass
 class RuntimeState:
     boot_time: float = field(default_factory=time.time)
-    active_tasks: int = 0
-    completed_tasks: int = 0
-    failed_tasks: int = 0
+    _c: array = field(default_factory=lambda: array("Q", [0, 0, 0]), repr=False)
     last_healthcheck: float = field(default_factory=time.time)
-    request_log: Dict[str, Any] = field(default_factory=dict)
+    request_log: OrderedDict = field(default_factory=OrderedDict)
     
     def new_request_id(self) -> str:
-        return str(uuid.uuid4())
+        return uuid.uuid4().hex
     
     def log_request(self, req_id: str, payload: Any):
+        # Only len(payload) is kept (the key count for a dict request), not
+        # a byte size; the request itself is not retained.
         self.request_log[req_id] = {
-            "payload": payload,
+            "payload_len": len(payload) if hasattr(payload, "__len__") else None,
             "timestamp": time.time(),
         }
+        if len(self.request_log) > MAX_REQUEST_LOG:
+            self.request_log.popitem(last=False)
+    
+    @property
+    def active_tasks(self) -> int:
+        return self._c[_ACTIVE]
+    
+    @property
+    def completed_tasks(self) -> int:
+        return self._c[_COMPLETED]
+    
+    @property
+    def failed_tasks(self) -> int:
+        return self._c[_FAILED]
     
     def increment_active(self):
-        self.active_tasks += 1
+        self._c[_ACTIVE] += 1
     
     def decrement_active(self):
-        self.active_tasks = max(0, self.active_tasks - 1)
+        c = self._c
+        if c[_ACTIVE]:
+            c[_ACTIVE] -= 1
     
     def complete(self):
-        self.completed_tasks += 1
+        self._c[_COMPLETED] += 1
     
     def fail(self):
-        self.failed_tasks += 1
+        self._c[_FAILED] += 1
@@ -0,0 +1,43 @@
+import asyncio
+import unittest
+
+from commons.events import Event, EventBus
+from commons.hooks import HookManager, HookName
+
+
+class GateLoopTests(unittest.TestCase):
+    def test_broadcast_under_contention_on_successive_loops(self):
+        bus = EventBus(max_parallel=2)
+        calls = []
+
+        async def slow(event):
+            await asyncio.sleep(0.01)
+            calls.append(event.name)
+
+        for _ in range(5):
+            bus.subscribe("gate.check", slow)
+
+        asyncio.run(bus.broadcast(Event(name="gate.check")))
+        asyncio.run(bus.broadcast(Event(name="gate.check")))
+
+        self.assertEqual(len(calls), 10)
+
+    def test_fire_under_contention_on_successive_loops(self):
+        hooks = HookManager(max_parallel=2)
+        calls = []
+
+        async def slow(ctx):
+            await asyncio.sleep(0.01)
+            calls.append(ctx["n"])
+
+        for _ in range(5):
+            hooks.register(HookName.BEFORE_ROUTER, slow)
+
+        asyncio.run(hooks.fire(HookName.BEFORE_ROUTER, {"n": 1}))
+        asyncio.run(hooks.fire(HookName.BEFORE_ROUTER, {"n": 2}))
+
+        self.assertEqual(calls, [1] * 5 + [2] * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
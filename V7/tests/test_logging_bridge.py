@@ -0,0 +1,44 @@
+import asyncio
+import logging
+import threading
+import unittest
+
+from commons.events import bus
+from commons.logging_bridge import LOG_EVENT, EventLogHandler
+
+
+class EventLogHandlerTests(unittest.TestCase):
+    def test_records_are_bridged_without_polling(self):
+        received = []
+
+        async def on_batch(event):
+            received.extend(r["message"] for r in event.payload["records"])
+
+        async def main():
+            handler = EventLogHandler()
+            log = logging.getLogger("tests.logging_bridge")
+            log.propagate = False
+            log.setLevel(logging.INFO)
+            log.addHandler(handler)
+            try:
+                log.info("before subscribe")
+                self.assertEqual(handler._q.qsize(), 0)
+
+                bus.subscribe(LOG_EVENT, on_batch)
+                log.info("loop")
+                await asyncio.sleep(0.01)
+
+                worker = threading.Thread(target=log.info, args=("thread",))
+                worker.start()
+                worker.join()
+                await asyncio.sleep(0.01)
+            finally:
+                log.removeHandler(handler)
+                handler._task.cancel()
+
+        asyncio.run(main())
+        self.assertEqual(received, ["loop", "thread"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from orchestrator.router.router_config import ModelBackendConfig, RouterConfig
+
+
+class BackendConfigTests(unittest.TestCase):
+    def _backend(self, **extra):
+        return ModelBackendConfig.from_dict({"name": "m", "endpoint": "http://m", **extra})
+
+    def test_string_false_disables_backend(self):
+        self.assertFalse(self._backend(enabled="false").enabled)
+        self.assertFalse(self._backend(enabled="0").enabled)
+        self.assertTrue(self._backend(enabled="Yes").enabled)
+
+    def test_unrecognised_bool_string_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self._backend(enabled="maybe")
+
+    def test_null_or_non_string_endpoint_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self._backend(endpoint=None)
+        with self.assertRaises(ValueError):
+            self._backend(endpoint=8080)
+
+
+class RouterConfigTests(unittest.TestCase):
+    def test_non_mapping_models_is_rejected(self):
+        with self.assertRaises(ValueError):
+            RouterConfig(default_model="m", models=["m"])
+
+
+if __name__ == "__main__":
+    unittest.main()
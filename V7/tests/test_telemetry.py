@@ -0,0 +1,29 @@
+import asyncio
+import unittest
+
+from commons import telemetry
+from commons.events import bus
+
+
+class TelemetryLoopTests(unittest.TestCase):
+    def test_queue_survives_successive_event_loops(self):
+        received = []
+
+        async def on_batch(event):
+            received.extend(item["name"] for item in event.payload["events"])
+
+        bus.subscribe(telemetry.TELEMETRY_EVENT, on_batch)
+
+        async def emit_and_flush():
+            await telemetry.emit_metric("loop.check", 1.0)
+            await telemetry.flush()
+
+        asyncio.run(emit_and_flush())
+        asyncio.run(emit_and_flush())
+
+        self.assertEqual(received, ["telemetry.metric", "telemetry.metric"])
+        self.assertEqual(telemetry.dropped_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,25 +1,30 @@
+import asyncio
 import os
-from fastapi import FastAPI, WebSocket, Depends, Request
+import time
+import orjson
+from fastapi import FastAPI, WebSocket, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 
 from .engine import orchestrate
-from .config import settings
+from .config import get_settings
 from .schemas import Health, SystemStatus, PrecedentRecord
 from .utils import gpu_utilization, MAX_INPUT_CHARS
-from .precedent import read_precedents, get_precedent, query_precedents
-from .db import read_precedents_db, get_precedent_db, query_precedents_db
+from .precedent import read_precedents, get_precedent, query_precedents, flush_precedents
+from .db import read_precedents_db, get_precedent_db, close_db
 from .security import require_api_key, WS_AUTH_REQUIRED
 from .logging_setup import configure_logging
 from .limits import limiter
 from .request_id import RequestIdMiddleware
 from .body_limit import BodySizeLimitMiddleware
+from .streaming import ws_send_json
 
 logger = configure_logging()
 
-app = FastAPI(title="ELEANOR Orchestrator v2 (Standalone)")
+app = FastAPI(title="ELEANOR Orchestrator v2 (Standalone)", default_response_class=ORJSONResponse)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_middleware(SlowAPIMiddleware)
@@ -35,14 +40,25 @@ app.add_middleware(
 )
 
 
-@app.get("/health", response_model=Health)
-async def health(_=Depends(require_api_key)):
-    return {"status": "ok"}
+# /system/status reads this snapshot; a background task refreshes it so the
+# handler never blocks the event loop on psutil/NVML.
+STATUS_REFRESH_SECONDS = float(os.getenv("ELEANOR_STATUS_REFRESH", "5"))
+_sys_cache = {"cpu": 0, "ram": 0, "gpu": 0, "ts": 0.0}
+_models_view: list | None = None
 
 
-@app.get("/system/status", response_model=SystemStatus)
-@limiter.limit("30/minute")
-async def system_status(request: Request, _=Depends(require_api_key)):
+def _get_models_view() -> list:
+    # Models are fixed for the process lifetime; built on first request.
+    global _models_view
+    if _models_view is None:
+        _models_view = [
+            {"name": name, "model": model, "loaded": True}
+            for name, model in get_settings().MODELS.items()
+        ]
+    return _models_view
+
+
+def _sample_system():
     try:
         import psutil
         cpu = int(psutil.cpu_percent())
@@ -50,14 +66,50 @@ async def system_status(request: Request, _=Depends(require_api_key)):
     except Exception:
         cpu = ram = 0
     gpu = gpu_utilization() or 0
+    return cpu, ram, gpu
+
+
+async def _sys_refresh_loop():
+    while True:
+        try:
+            cpu, ram, gpu = await asyncio.to_thread(_sample_system)
+            _sys_cache.update(cpu=cpu, ram=ram, gpu=gpu, ts=time.time())
+        except Exception:
+            logger.exception("system status refresh failed")
+        await asyncio.sleep(STATUS_REFRESH_SECONDS)
+
+
+@app.on_event("startup")
+async def _start_sys_refresh():
+    app.state.sys_refresh = asyncio.create_task(_sys_refresh_loop())
+
+
+@app.on_event("shutdown")
+async def _stop_sys_refresh():
+    task = getattr(app.state, "sys_refresh", None)
+    if task:
+        task.cancel()
+
+
+@app.on_event("shutdown")
+async def _close_db():
+    await flush_precedents()
+    await close_db()
+
+
+@app.get("/health", response_model=Health)
+async def health(_=Depends(require_api_key)):
+    return {"status": "ok"}
+
+
+@app.get("/system/status", response_model=SystemStatus)
+@limiter.limit("30/minute")
+async def system_status(request: Request, _=Depends(require_api_key)):
     return {
-        "cpu": cpu,
-        "ram": ram,
-        "gpu": gpu,
-        "models": [
-            {"name": name, "model": model, "loaded": True}
-            for name, model in settings.MODELS.items()
-        ],
+        "cpu": _sys_cache["cpu"],
+        "ram": _sys_cache["ram"],
+        "gpu": _sys_cache["gpu"],
+        "models": _get_models_view(),
     }
 
 
@@ -69,24 +121,24 @@ async def deliberation_stream(ws: WebSocket):
     if WS_AUTH_REQUIRED:
         from .security import validate_ws_api_key
         if not validate_ws_api_key(headers, queries):
-            await ws.send_json({"error": "Unauthorized"})
+            await ws_send_json(ws, {"error": "Unauthorized"})
             await ws.close(code=1008)
             return
 
     try:
-        start_msg = await ws.receive_json()
+        start_msg = orjson.loads(await ws.receive_text())
     except Exception:
-        await ws.send_json({"error": "Invalid JSON payload"})
+        await ws_send_json(ws, {"error": "Invalid JSON payload"})
         await ws.close(code=1003)
         return
 
     user_input = start_msg.get("input", "")
     if not user_input or len(str(user_input)) > MAX_INPUT_CHARS:
-        await ws.send_json({"error": "Input missing or too large"})
+        await ws_send_json(ws, {"error": "Input missing or too large"})
         await ws.close(code=1003)
         return
 
-    adapter = settings.build_adapter()
+    adapter = get_settings().build_adapter()
     await orchestrate(ws, user_input, adapter)
     await ws.close()
 
@@ -97,7 +149,7 @@ async def list_precedents(request: Request, _=Depends(require_api_key)):
     try:
         records = await read_precedents_db()
     except Exception:
-        records = read_precedents()
+        records = await read_precedents()
     return records
 
 
@@ -107,7 +159,7 @@ async def fetch_precedent(precedent_id: str, request: Request, _=Depends(require
     try:
         rec = await get_precedent_db(precedent_id)
     except Exception:
-        rec = get_precedent(precedent_id)
+        rec = await get_precedent(precedent_id)
     return rec
 
 
@@ -115,19 +167,13 @@ async def fetch_precedent(precedent_id: str, request: Request, _=Depends(require
 @limiter.limit("20/minute")
 async def search_precedents(payload: dict, request: Request, _=Depends(require_api_key)):
     text_query = payload.get("q") or payload.get("query")
+    if text_query is not None and not isinstance(text_query, str):
+        raise HTTPException(status_code=400, detail="q must be a string")
     tag = payload.get("tag")
     severity = payload.get("severity")
     flag = payload.get("flag")
     sort = payload.get("sort")  # "newest" | "oldest" | None
     limit = payload.get("limit")
-    try:
-        records = await query_precedents_db(text_query, tag=tag, severity=severity, flag=flag, sort=sort or "newest", limit=limit)
-    except Exception:
-        records = query_precedents(text_query, tag=tag, severity=severity, flag=flag)
-    if sort == "newest":
-        records = sorted(records, key=lambda r: r.timestamp, reverse=True)
-    elif sort == "oldest":
-        records = sorted(records, key=lambda r: r.timestamp)
-    if isinstance(limit, int) and limit > 0:
-        records = records[:limit]
+    limit = limit if isinstance(limit, int) else None
+    records = await query_precedents(text_query, tag=tag, severity=severity, flag=flag, sort=sort, limit=limit)
     return records
@@ -3,14 +3,22 @@ from starlette.requests import Request
 from starlette.responses import Response
 from .security import MAX_BODY_BYTES
 
+# Only these methods carry request bodies in this API.
+_BODY_METHODS = frozenset(("POST", "PUT", "PATCH"))
+
 class BodySizeLimitMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         # For WebSocket, skip
-        if request.scope.get("type") == "websocket":
+        if request.scope.get("type") == "websocket" or request.method not in _BODY_METHODS:
             return await call_next(request)
         # Enforce content-length if present
         cl = request.headers.get("content-length")
-        if cl and int(cl) > MAX_BODY_BYTES:
-            return Response(status_code=413, content="Payload too large")
+        if cl:
+            try:
+                size = int(cl)
+            except ValueError:
+                return Response(status_code=400, content="Invalid Content-Length")
+            if size > MAX_BODY_BYTES:
+                return Response(status_code=413, content="Payload too large")
         # For streamed bodies, Starlette buffers by default; rely on content-length header
         return await call_next(request)
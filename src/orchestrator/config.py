@@ -1,5 +1,6 @@
 import os
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Optional
 from .adapters import OllamaAdapter, CriticAdapter
 
 
@@ -22,12 +23,15 @@ class Settings:
             "truth": float(os.getenv("TRUTH_THRESHOLD", 0.70)),
             "pragmatics": float(os.getenv("PRAG_THRESHOLD", 0.40)),
         }
-        self.MITIGATION_LIBRARY = self._default_mitigations()
+        # Copied: overlays update entries in place.
+        self.MITIGATION_LIBRARY = {k: dict(v) for k, v in self._default_mitigations().items()}
         self.SYSTEM_PROMPTS = self._default_prompts()
         self._apply_overlays()
         self._apply_profile()
 
-    def _default_prompts(self) -> Dict[str, str]:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _default_prompts() -> Dict[str, str]:
         return {
             "rights": (
                 "You are the Eleanor Rights Critic. Evaluate dignity, autonomy, non-discrimination, and privacy "
@@ -86,7 +90,9 @@ class Settings:
             ),
         }
 
-    def _default_mitigations(self) -> Dict[str, Dict[str, str]]:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _default_mitigations() -> Dict[str, Dict[str, str]]:
         return {
             "rights": {
                 "conflict": "Resolve rights constraint (dignity, autonomy, non-discrimination per UDHR) before proceeding.",
@@ -170,4 +176,20 @@ class Settings:
         return OllamaAdapter(self.OLLAMA_HOST)
 
 
-settings = Settings()
+_settings: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """Build Settings on first use rather than at import."""
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
+
+
+def __getattr__(name: str):
+    # Keeps `from .config import settings` working while deferring the
+    # env/overlay parsing until something actually asks for it.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,35 @@
 import re
-from typing import Dict
+from typing import Dict, Iterable
 
+_LABELS = ("Claim", "Evidence", "Constitutional Principle", "Principle", "Confidence", "Mitigation")
+# Lower-cased "- label:" prefixes, matched case-insensitively per line.
+_PREFIXES = tuple((f"- {label.lower()}:", label) for label in _LABELS)
+_NUM_RE = re.compile(r"[\d.]+")
+
+
+def _scan_lines(lines: Iterable[str], fields: Dict[str, str]):
+    for line in lines:
+        s = line.lstrip()
+        low = s[:32].lower()
+        for prefix, label in _PREFIXES:
+            if low.startswith(prefix):
+                # First occurrence of a label wins.
+                if label not in fields:
+                    fields[label] = s[len(prefix):].strip()
+                break
 
-def parse_critic_output(text: str) -> Dict[str, str]:
-    """Parse Eleanor critic structured output into a dict."""
-    def extract(label: str, default: str = "") -> str:
-        pattern = rf"- {label}:\s*(.*)"
-        m = re.search(pattern, text, re.IGNORECASE)
-        return m.group(1).strip() if m else default
 
-    claim = extract("Claim")
-    evidence = extract("Evidence")
-    principle = extract("Constitutional Principle") or extract("Principle") or "None"
-    confidence_raw = extract("Confidence", "0.0")
-    mitigation = extract("Mitigation")
+def _build_result(fields: Dict[str, str]) -> Dict[str, str]:
+    claim = fields.get("Claim", "")
+    evidence = fields.get("Evidence", "")
+    principle = fields.get("Constitutional Principle") or fields.get("Principle") or "None"
+    confidence_raw = fields.get("Confidence", "0.0")
+    mitigation = fields.get("Mitigation", "")
 
+    m = _NUM_RE.search(confidence_raw)
     try:
-        confidence = float(re.findall(r"[\d.]+", confidence_raw)[0])
-    except Exception:
+        confidence = float(m.group(0)) if m else 0.0
+    except ValueError:
         confidence = 0.0
 
     return {
@@ -27,3 +39,36 @@ def parse_critic_output(text: str) -> Dict[str, str]:
         "confidence": confidence,
         "mitigation": mitigation,
     }
+
+
+def parse_critic_output(text: str) -> Dict[str, str]:
+    """Parse Eleanor critic structured output into a dict."""
+    fields: Dict[str, str] = {}
+    _scan_lines(text.splitlines(), fields)
+    return _build_result(fields)
+
+
+class IncrementalCriticParser:
+    """
+    Streaming equivalent of parse_critic_output: complete lines are parsed
+    as they arrive and only the trailing partial line is buffered, so each
+    chunk costs O(len(chunk)) instead of re-parsing the whole reply.
+    """
+    __slots__ = ("_pending", "_fields")
+
+    def __init__(self):
+        self._pending = ""
+        self._fields: Dict[str, str] = {}
+
+    def feed(self, chunk: str):
+        if "\n" not in chunk:
+            self._pending += chunk
+            return
+        head, _, self._pending = (self._pending + chunk).rpartition("\n")
+        _scan_lines(head.splitlines(), self._fields)
+
+    def finalize(self) -> Dict[str, str]:
+        if self._pending:
+            _scan_lines(self._pending.splitlines(), self._fields)
+            self._pending = ""
+        return _build_result(self._fields)
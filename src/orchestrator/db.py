@@ -1,9 +1,13 @@
+from __future__ import annotations
+
 import os
 import asyncio
 import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-import aiosqlite
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import aiosqlite
 
 DB_PATH = os.getenv("ELEANOR_DB_PATH", "eleanor.db")
 
@@ -23,60 +27,202 @@ CREATE TABLE IF NOT EXISTS precedents (
 );
 CREATE INDEX IF NOT EXISTS idx_precedents_created_at ON precedents(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_precedents_severity ON precedents(severity);
+
+-- Full-text index over input/outcome. It keeps its own copy of the text
+-- because precedents has no INTEGER PRIMARY KEY (rowids are unstable).
+CREATE VIRTUAL TABLE IF NOT EXISTS precedents_fts USING fts5(
+    precedent_id UNINDEXED, input_text, outcome
+);
+
+-- Tags/flags normalised out of the JSON columns for indexed lookups.
+CREATE TABLE IF NOT EXISTS precedent_tags (
+    precedent_id TEXT NOT NULL,
+    tag TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (precedent_id, tag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_precedent_tags_tag ON precedent_tags(tag, precedent_id);
+CREATE TABLE IF NOT EXISTS precedent_flags (
+    precedent_id TEXT NOT NULL,
+    flag TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (precedent_id, flag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_precedent_flags_flag ON precedent_flags(flag, precedent_id);
+
+CREATE TRIGGER IF NOT EXISTS precedents_ai AFTER INSERT ON precedents BEGIN
+    INSERT INTO precedents_fts (precedent_id, input_text, outcome)
+        VALUES (new.precedent_id, new.input_text, new.outcome);
+    INSERT OR IGNORE INTO precedent_tags (precedent_id, tag)
+        SELECT new.precedent_id, value FROM json_each(CASE WHEN json_valid(new.tags) THEN new.tags ELSE '[]' END);
+    INSERT OR IGNORE INTO precedent_flags (precedent_id, flag)
+        SELECT new.precedent_id, value FROM json_each(CASE WHEN json_valid(new.flags) THEN new.flags ELSE '[]' END);
+END;
+CREATE TRIGGER IF NOT EXISTS precedents_ad AFTER DELETE ON precedents BEGIN
+    DELETE FROM precedents_fts WHERE precedent_id = old.precedent_id;
+    DELETE FROM precedent_tags WHERE precedent_id = old.precedent_id;
+    DELETE FROM precedent_flags WHERE precedent_id = old.precedent_id;
+END;
+CREATE TRIGGER IF NOT EXISTS precedents_au AFTER UPDATE ON precedents BEGIN
+    DELETE FROM precedents_fts WHERE precedent_id = old.precedent_id;
+    DELETE FROM precedent_tags WHERE precedent_id = old.precedent_id;
+    DELETE FROM precedent_flags WHERE precedent_id = old.precedent_id;
+    INSERT INTO precedents_fts (precedent_id, input_text, outcome)
+        VALUES (new.precedent_id, new.input_text, new.outcome);
+    INSERT OR IGNORE INTO precedent_tags (precedent_id, tag)
+        SELECT new.precedent_id, value FROM json_each(CASE WHEN json_valid(new.tags) THEN new.tags ELSE '[]' END);
+    INSERT OR IGNORE INTO precedent_flags (precedent_id, flag)
+        SELECT new.precedent_id, value FROM json_each(CASE WHEN json_valid(new.flags) THEN new.flags ELSE '[]' END);
+END;
+"""
+
+# Populates the search tables for databases created before they existed.
+BACKFILL_SQL = """
+INSERT INTO precedents_fts (precedent_id, input_text, outcome)
+    SELECT precedent_id, input_text, outcome FROM precedents;
+INSERT OR IGNORE INTO precedent_tags (precedent_id, tag)
+    SELECT p.precedent_id, j.value FROM precedents p, json_each(p.tags) j WHERE json_valid(p.tags);
+INSERT OR IGNORE INTO precedent_flags (precedent_id, flag)
+    SELECT p.precedent_id, j.value FROM precedents p, json_each(p.flags) j WHERE json_valid(p.flags);
 """
 
 
+PRAGMA_SQL = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-20000;
+PRAGMA mmap_size=268435456;
+"""
+
+# sqlite3 keeps prepared statements per connection keyed by SQL text, so
+# queries are built from constant strings and bind LIMIT as a parameter
+# (-1 means no limit) to keep hitting that cache.
+_ORDER = {"newest": "DESC"}
+READ_SQL = {
+    order: f"SELECT * FROM precedents ORDER BY created_at {order} LIMIT ?"
+    for order in ("ASC", "DESC")
+}
+_TEXT_CLAUSE = "precedent_id IN (SELECT precedent_id FROM precedents_fts WHERE precedents_fts MATCH ?)"
+_TAG_CLAUSE = "precedent_id IN (SELECT precedent_id FROM precedent_tags WHERE tag = ?)"
+_SEVERITY_CLAUSE = "LOWER(severity) = LOWER(?)"
+_FLAG_CLAUSE = "precedent_id IN (SELECT precedent_id FROM precedent_flags WHERE flag = ?)"
+
+
+def _limit_param(limit: Optional[int]) -> int:
+    return int(limit) if limit else -1
+
+# One long-lived connection per process; aiosqlite serialises access on
+# its worker thread, so it can be shared by concurrent requests.
+_conn: Optional[aiosqlite.Connection] = None
+# (loop, lock): asyncio locks bind to the loop that first contends for
+# them, so a fresh one is made whenever the running loop changes.
+_conn_lock: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = None
+
+
+def _get_conn_lock() -> asyncio.Lock:
+    global _conn_lock
+    loop = asyncio.get_running_loop()
+    if _conn_lock is None or _conn_lock[0] is not loop:
+        _conn_lock = (loop, asyncio.Lock())
+    return _conn_lock[1]
+
+
+async def _get_conn() -> aiosqlite.Connection:
+    global _conn
+    if _conn is not None:
+        return _conn
+    async with _get_conn_lock():
+        if _conn is None:
+            # Imported here so importing this module stays cheap.
+            import aiosqlite
+            db = await aiosqlite.connect(DB_PATH)
+            try:
+                db.row_factory = aiosqlite.Row
+                await db.executescript(PRAGMA_SQL)
+                async with db.execute("SELECT 1 FROM sqlite_master WHERE name = 'precedents_fts'") as cursor:
+                    has_fts = await cursor.fetchone() is not None
+                await db.executescript(CREATE_SQL)
+                if not has_fts:
+                    await db.executescript(BACKFILL_SQL)
+                await db.commit()
+            except BaseException:
+                # Close the half-set-up connection so its worker thread
+                # does not leak; the next call retries from scratch.
+                await db.close()
+                raise
+            _conn = db
+    return _conn
+
+
 async def init_db():
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.executescript(CREATE_SQL)
-        await db.commit()
+    await _get_conn()
+
+
+async def close_db():
+    global _conn
+    if _conn is not None:
+        db, _conn = _conn, None
+        await db.close()
+
+
+# Upsert rather than INSERT OR REPLACE: REPLACE deletes without firing the
+# delete trigger, which would leave stale search rows behind.
+INSERT_SQL = """
+INSERT INTO precedents
+(precedent_id, input_text, outcome, confidence, mitigations, critics, flags, tags, severity, audit_hash, created_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(precedent_id) DO UPDATE SET
+    input_text = excluded.input_text,
+    outcome = excluded.outcome,
+    confidence = excluded.confidence,
+    mitigations = excluded.mitigations,
+    critics = excluded.critics,
+    flags = excluded.flags,
+    tags = excluded.tags,
+    severity = excluded.severity,
+    audit_hash = excluded.audit_hash,
+    created_at = excluded.created_at
+"""
+
+
+def _record_to_row(record: Dict[str, Any], created_at: str) -> tuple:
+    return (
+        record.get("precedentId"),
+        record.get("input"),
+        record.get("outcome"),
+        record.get("confidence", 0.0),
+        json.dumps(record.get("mitigations", []), ensure_ascii=False),
+        json.dumps(record.get("critics", {}), ensure_ascii=False),
+        json.dumps(record.get("flags", []), ensure_ascii=False),
+        json.dumps(record.get("tags", []), ensure_ascii=False),
+        record.get("severity", "medium"),
+        record.get("auditHash"),
+        created_at,
+    )
 
 
 async def store_precedent_db(record: Dict[str, Any]) -> str:
-    await init_db()
-    precedent_id = record.get("precedentId")
-    mitigations = json.dumps(record.get("mitigations", []), ensure_ascii=False)
-    critics = json.dumps(record.get("critics", {}), ensure_ascii=False)
-    flags = json.dumps(record.get("flags", []), ensure_ascii=False)
-    tags = json.dumps(record.get("tags", []), ensure_ascii=False)
-    created_at = datetime.utcnow().isoformat() + "Z"
-
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            """
-            INSERT OR REPLACE INTO precedents
-            (precedent_id, input_text, outcome, confidence, mitigations, critics, flags, tags, severity, audit_hash, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                precedent_id,
-                record.get("input"),
-                record.get("outcome"),
-                record.get("confidence", 0.0),
-                mitigations,
-                critics,
-                flags,
-                tags,
-                record.get("severity", "medium"),
-                record.get("auditHash"),
-                created_at,
-            ),
-        )
-        await db.commit()
-    return precedent_id
+    await store_precedents_db([record])
+    return record.get("precedentId")
+
+
+async def store_precedents_db(records: List[Dict[str, Any]], created_at: Optional[List[str]] = None) -> None:
+    """
+    Insert a batch of precedents in a single transaction. created_at
+    gives each record's timestamp; records are stamped now when omitted.
+    """
+    if created_at is None:
+        created_at = [datetime.utcnow().isoformat() + "Z"] * len(records)
+    db = await _get_conn()
+    await db.executemany(INSERT_SQL, [_record_to_row(r, ts) for r, ts in zip(records, created_at)])
+    await db.commit()
 
 
 async def read_precedents_db(limit: Optional[int] = None, sort: str = "newest") -> List[Dict[str, Any]]:
-    await init_db()
-    order = "DESC" if sort == "newest" else "ASC"
-    sql = f"SELECT * FROM precedents ORDER BY created_at {order}"
-    if limit:
-        sql += f" LIMIT {int(limit)}"
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(sql) as cursor:
-            rows = await cursor.fetchall()
-            return [_row_to_dict(r) for r in rows]
+    sql = READ_SQL[_ORDER.get(sort, "ASC")]
+    db = await _get_conn()
+    async with db.execute(sql, (_limit_param(limit),)) as cursor:
+        rows = await cursor.fetchall()
+        return [_row_to_dict(r) for r in rows]
 
 
 def _row_to_dict(row: aiosqlite.Row) -> Dict[str, Any]:
@@ -91,47 +237,56 @@ def _row_to_dict(row: aiosqlite.Row) -> Dict[str, Any]:
         "tags": json.loads(row["tags"] or "[]"),
         "severity": row["severity"],
         "auditHash": row["audit_hash"],
-        "timestamp": row["created_at"],
+        "timestamp": _epoch(row["created_at"]),
     }
 
 
+def _epoch(created_at: Optional[str]) -> int:
+    # created_at is stored as ISO-8601 UTC; PrecedentRecord.timestamp is
+    # epoch seconds, matching the JSONL records.
+    try:
+        return int(datetime.fromisoformat(created_at).timestamp())
+    except (TypeError, ValueError):
+        return 0
+
+
 async def get_precedent_db(precedent_id: str) -> Optional[Dict[str, Any]]:
-    await init_db()
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute("SELECT * FROM precedents WHERE precedent_id = ?", (precedent_id,)) as cursor:
-            row = await cursor.fetchone()
-            if not row:
-                return None
-            return _row_to_dict(row)
+    db = await _get_conn()
+    async with db.execute("SELECT * FROM precedents WHERE precedent_id = ?", (precedent_id,)) as cursor:
+        row = await cursor.fetchone()
+        if not row:
+            return None
+        return _row_to_dict(row)
+
+
+def _fts_phrase(text: str) -> str:
+    """Quote user text as one FTS5 phrase, prefix-matching the last token."""
+    return '"' + text.replace('"', '""') + '"*'
 
 
 async def query_precedents_db(text_query: Optional[str] = None, tag: Optional[str] = None, severity: Optional[str] = None, flag: Optional[str] = None, sort: str = "newest", limit: Optional[int] = None) -> List[Dict[str, Any]]:
-    await init_db()
-    order = "DESC" if sort == "newest" else "ASC"
+    order = _ORDER.get(sort, "ASC")
     clauses = []
     params = []
     if text_query:
-        clauses.append("(input_text LIKE ? OR outcome LIKE ?)")
-        tq = f"%{text_query}%"
-        params.extend([tq, tq])
+        clauses.append(_TEXT_CLAUSE)
+        params.append(_fts_phrase(text_query))
     if tag:
-        clauses.append("tags LIKE ?")
-        params.append(f"%{tag}%")
+        clauses.append(_TAG_CLAUSE)
+        params.append(tag)
     if severity:
-        clauses.append("LOWER(severity) = LOWER(?)")
+        clauses.append(_SEVERITY_CLAUSE)
         params.append(severity)
     if flag:
-        clauses.append("flags LIKE ?")
-        params.append(f"%{flag}%")
-
-    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
-    sql = f"SELECT * FROM precedents {where} ORDER BY created_at {order}"
-    if limit:
-        sql += f" LIMIT {int(limit)}"
-
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(sql, params) as cursor:
-            rows = await cursor.fetchall()
-            return [_row_to_dict(r) for r in rows]
+        clauses.append(_FLAG_CLAUSE)
+        params.append(flag)
+    if not clauses:
+        sql = READ_SQL[order]
+    else:
+        sql = f"SELECT * FROM precedents WHERE {' AND '.join(clauses)} ORDER BY created_at {order} LIMIT ?"
+    params.append(_limit_param(limit))
+
+    db = await _get_conn()
+    async with db.execute(sql, params) as cursor:
+        rows = await cursor.fetchall()
+        return [_row_to_dict(r) for r in rows]
@@ -3,49 +3,94 @@ import time
 from typing import Dict
 import uuid
 import hashlib
+from functools import lru_cache
 
-from .config import settings
+from .config import get_settings
 from .adapters import CriticAdapter
-from .critics import parse_critic_output
+from .critics import IncrementalCriticParser
 from .schemas import DeliberationEvent, ConflictEvent, FinalDecision, CriticBreakdown
-from .streaming import emit
+from .streaming import WsBatcher, emit
 from .precedent import store_precedent
-from .utils import heuristic_confidence_from_text, confidence_from_logprobs, PROTECTED_CLASSES, SENSITIVE_TOPICS
+from .utils import StreamingConfidence, confidence_from_logprobs, PROTECTED_CLASSES_RE
 from .logging_setup import configure_logging
 
 CRITICS = ["rights", "fairness", "risk", "truth", "pragmatics"]
 
 
+def _build_conflict_rules(thr: Dict[str, float]):
+    """
+    One check per critic, closed over its threshold so the per-chunk path
+    is a single dict lookup and call. Each rule receives the lower-cased
+    principle and claim, the confidence and the raw parse.
+    """
+    rights_thr = thr["rights"]
+    risk_thr = thr["risk"]
+    fairness_thr = thr["fairness"]
+    truth_thr = thr["truth"]
+    prag_thr = thr["pragmatics"]
+
+    def rights(principle, confidence, claim, parsed):
+        if principle != "none" and confidence > rights_thr:
+            return ConflictEvent(critic="rights", severity="high", message="Potential rights violation detected (UDHR).")
+        if PROTECTED_CLASSES_RE.search(claim):
+            return ConflictEvent(critic="rights", severity="high", message="Protected class detected; check non-discrimination (UDHR/UNESCO).")
+        if "consent" not in claim and "consent" not in parsed.get("evidence", "").lower():
+            return ConflictEvent(critic="rights", severity="medium", message="Consent not evident; verify autonomy (UDHR Art. 1,12).")
+        return None
+
+    def risk(principle, confidence, claim, parsed):
+        if (principle != "none" or "harm" in claim) and confidence > risk_thr:
+            return ConflictEvent(critic="risk", severity="medium", message="Potential high-risk action detected.")
+        return None
+
+    def fairness(principle, confidence, claim, parsed):
+        if principle != "none" and confidence > fairness_thr:
+            return ConflictEvent(critic="fairness", severity="medium", message="Potential distributional harm detected.")
+        return None
+
+    def truth(principle, confidence, claim, parsed):
+        if principle != "none" and confidence > truth_thr:
+            return ConflictEvent(critic="truth", severity="low", message="Potential misinformation detected.")
+        return None
+
+    def pragmatics(principle, confidence, claim, parsed):
+        if confidence < prag_thr:
+            return ConflictEvent(critic="pragmatics", severity="low", message="Feasibility uncertain; clarify constraints.")
+        return None
+
+    return {
+        "rights": rights,
+        "risk": risk,
+        "fairness": fairness,
+        "truth": truth,
+        "pragmatics": pragmatics,
+    }
+
+
+@lru_cache(maxsize=None)
+def _conflict_rules():
+    # Built on first use so importing the engine does not construct Settings.
+    return _build_conflict_rules(get_settings().THRESHOLDS)
+
+
 def _conflict_checks(critic: str, parsed: Dict[str, str]) -> ConflictEvent | None:
+    rule = _conflict_rules().get(critic)
+    if rule is None:
+        return None
     principle = (parsed.get("constitutional_principle", "none") or "none").lower()
     confidence = parsed.get("confidence", 0.0) or 0.0
     claim = parsed.get("claim", "").lower()
+    return rule(principle, confidence, claim, parsed)
 
-    thr = settings.THRESHOLDS
-    tags_local: list[str] = []
 
-    if critic == "rights" and principle != "none" and confidence > thr["rights"]:
-        tags_local.append("udhr")
-        return ConflictEvent(critic="rights", severity="high", message="Potential rights violation detected (UDHR).")
-    if critic == "rights":
-        if any(term in claim for term in PROTECTED_CLASSES):
-            tags_local.append("protected_class")
-            return ConflictEvent(critic="rights", severity="high", message="Protected class detected; check non-discrimination (UDHR/UNESCO).")
-        if "consent" not in claim and "consent" not in parsed.get("evidence", "").lower():
-            tags_local.append("consent")
-            return ConflictEvent(critic="rights", severity="medium", message="Consent not evident; verify autonomy (UDHR Art. 1,12).")
-    if critic == "risk" and (principle != "none" or "harm" in claim) and confidence > thr["risk"]:
-        return ConflictEvent(critic="risk", severity="medium", message="Potential high-risk action detected.")
-    if critic == "fairness" and principle != "none" and confidence > thr["fairness"]:
-        return ConflictEvent(critic="fairness", severity="medium", message="Potential distributional harm detected.")
-    if critic == "truth" and principle != "none" and confidence > thr["truth"]:
-        return ConflictEvent(critic="truth", severity="low", message="Potential misinformation detected.")
-    if critic == "pragmatics" and confidence < thr["pragmatics"]:
-        return ConflictEvent(critic="pragmatics", severity="low", message="Feasibility uncertain; clarify constraints.")
-    return None
-
-
-async def run_critic_stream(ws, critic: str, adapter: CriticAdapter, user_input: str, results: dict):
+@lru_cache(maxsize=None)
+def _critic_config():
+    """(critic, model, system prompt), resolved once from settings."""
+    settings = get_settings()
+    return tuple((c, settings.MODELS[c], settings.SYSTEM_PROMPTS[c]) for c in CRITICS)
+
+
+async def run_critic_stream(stream: WsBatcher, critic: str, model: str, system_prompt: str, adapter: CriticAdapter, user_input: str, results: dict):
     """
     Stream a single critic:
     - announce start
@@ -54,13 +99,12 @@ async def run_critic_stream(ws, critic: str, adapter: CriticAdapter, user_input:
     - emit conflicts
     - emit completion event
     """
-    model = settings.MODELS[critic]
-    system_prompt = settings.SYSTEM_PROMPTS[critic]
-
     # Signal start
-    await emit(ws, DeliberationEvent(critic=critic, message=f"{critic} critic starting", confidence=0.05).dict())
+    await emit(stream, DeliberationEvent(critic=critic, message=f"{critic} critic starting", confidence=0.05))
 
-    collected_text = ""
+    # Both advance per chunk instead of re-scanning the accumulated reply.
+    parser = IncrementalCriticParser()
+    heuristic = StreamingConfidence(base=0.12)
     try:
         async for chunk in adapter.stream(model, system_prompt, user_input):
             if not chunk:
@@ -76,43 +120,45 @@ async def run_critic_stream(ws, critic: str, adapter: CriticAdapter, user_input:
             if not content:
                 continue
 
-            collected_text += content
-            token_conf = confidence_from_logprobs(logprobs) if logprobs else heuristic_confidence_from_text(collected_text, base=0.12)
-            await emit(
-                ws,
-                DeliberationEvent(
-                    critic=critic,
-                    message=content,
-                    confidence=token_conf,
-                ).dict(),
-            )
+            parser.feed(content)
+            text_conf = heuristic.feed(content)
+            token_conf = confidence_from_logprobs(logprobs) if logprobs else text_conf
+            # Per-token hot path: build the DeliberationEvent payload directly
+            # rather than validating a model per token.
+            await emit(stream, {
+                "type": "deliberation_event",
+                "critic": critic,
+                "message": content,
+                "confidence": token_conf,
+                "timestamp": time.time(),
+            })
     except Exception as exc:
         # fallback to non-streaming
         await emit(
-            ws,
+            stream,
             ConflictEvent(
                 critic=critic,
                 severity="low",
                 message=f"{critic} critic stream failed, falling back to completion: {exc}",
-            ).dict(),
+            ),
         )
         resp = await adapter.complete(model, system_prompt, user_input)
         content = resp.get("message", {}).get("content", "") if isinstance(resp, dict) else ""
-        collected_text += content
+        parser.feed(content)
 
-    parsed = parse_critic_output(collected_text)
+    parsed = parser.finalize()
     results[critic] = parsed
 
     conflict = _conflict_checks(critic, parsed)
     if conflict:
-        await emit(ws, conflict.dict())
+        await emit(stream, conflict)
 
     # Final critic completion event
-    await emit(ws, DeliberationEvent(
+    await emit(stream, DeliberationEvent(
         critic=critic,
         message=f"{critic} critic complete",
         confidence=parsed.get("confidence", 0.0),
-    ).dict())
+    ))
 
 
 logger = configure_logging()
@@ -124,32 +170,37 @@ async def orchestrate(ws, user_input: str, adapter: CriticAdapter):
     audit_id = f"AUD-{uuid.uuid4()}"
     audit_hash = hashlib.sha256(user_input.encode("utf-8")).hexdigest()
 
-    async with asyncio.TaskGroup() as tg:
-        for critic in CRITICS:
-            tg.create_task(run_critic_stream(ws, critic, adapter, user_input, results))
-
-    final = compute_final_decision(results, conflicts)
-    final.auditId = audit_id
-    final.auditHash = audit_hash
-    # Persist precedent
-    case_id = store_precedent({
-        "input": user_input,
-        "outcome": final.outcome,
-        "confidence": final.confidence,
-        "mitigations": final.mitigations,
-        "critics": results,
-        "precedentId": final.precedentId,
-        "timestamp": int(time.time()),
-        "flags": final.flags,
-        "tags": _build_tags(results, final),
-        "severity": final.severity,
-        "auditId": audit_id,
-        "auditHash": audit_hash,
-    })
-    final.precedentId = case_id
-
-    logger.info({"event": "deliberation_complete", "auditId": audit_id, "precedentId": case_id, "outcome": final.outcome, "flags": final.flags})
-    await emit(ws, final.dict())
+    stream = WsBatcher(ws)
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for critic, model, system_prompt in _critic_config():
+                tg.create_task(run_critic_stream(stream, critic, model, system_prompt, adapter, user_input, results))
+
+        final = compute_final_decision(results, conflicts)
+        final.auditId = audit_id
+        final.auditHash = audit_hash
+        # Persist precedent
+        case_id = await store_precedent({
+            "input": user_input,
+            "outcome": final.outcome,
+            "confidence": final.confidence,
+            "mitigations": final.mitigations,
+            "critics": results,
+            "precedentId": final.precedentId,
+            "timestamp": int(time.time()),
+            "flags": final.flags,
+            "tags": _build_tags(results, final),
+            "severity": final.severity,
+            "auditId": audit_id,
+            "auditHash": audit_hash,
+        })
+        final.precedentId = case_id
+
+        logger.info({"event": "deliberation_complete", "auditId": audit_id, "precedentId": case_id, "outcome": final.outcome, "flags": final.flags})
+        await emit(stream, final)
+    finally:
+        # Flush anything still queued before the caller closes the socket.
+        await stream.aclose()
     return final
 
 
@@ -165,59 +216,70 @@ def _build_tags(results: Dict[str, Dict], final: FinalDecision) -> list[str]:
     return tags
 
 
+@lru_cache(maxsize=None)
+def _decision_rules():
+    """
+    Escalation precedence for compute_final_decision with thresholds and
+    conflict mitigations pre-resolved on first use:
+    ((critic, outcome, threshold, mitigation), ...), plus the pragmatics
+    threshold and mitigation.
+    """
+    settings = get_settings()
+    rules = tuple(
+        (c, outcome, settings.THRESHOLDS[c], settings.MITIGATION_LIBRARY[c]["conflict"])
+        for c, outcome in (
+            ("rights", "blocked"),
+            ("risk", "blocked"),
+            ("fairness", "allowed_with_mitigations"),
+            ("truth", "allowed_with_mitigations"),
+        )
+    )
+    return (
+        rules,
+        settings.THRESHOLDS["pragmatics"],
+        settings.MITIGATION_LIBRARY["pragmatics"]["conflict"],
+    )
+
+_SEVERITY_BY_OUTCOME = {
+    "blocked": "high",
+    "needs_clarification": "medium",
+    "allowed_with_mitigations": "medium",
+}
+
+
 def compute_final_decision(results: Dict[str, Dict], conflicts: list[str]) -> FinalDecision:
     # Simple aggregation; rights/risk/fairness take precedence
     outcome = "allowed_with_mitigations"
     mitigations: list[str] = []
-
-    thr = settings.THRESHOLDS
-    lib = settings.MITIGATION_LIBRARY
-
-    rights = results.get("rights", {})
-    risk = results.get("risk", {})
-    fairness = results.get("fairness", {})
-    truth = results.get("truth", {})
-    prag = results.get("pragmatics", {})
-
-    if rights.get("constitutional_principle", "none").lower() != "none" and rights.get("confidence", 0) > thr["rights"]:
-        outcome = "blocked"
-        mitigations.append(lib["rights"]["conflict"])
-        conflicts.append("rights")
-    elif risk.get("constitutional_principle", "none").lower() != "none" and risk.get("confidence", 0) > thr["risk"]:
-        outcome = "blocked"
-        mitigations.append(lib["risk"]["conflict"])
-        conflicts.append("risk")
-    elif fairness.get("constitutional_principle", "none").lower() != "none" and fairness.get("confidence", 0) > thr["fairness"]:
-        outcome = "allowed_with_mitigations"
-        mitigations.append(lib["fairness"]["conflict"])
-        conflicts.append("fairness")
-    elif truth.get("constitutional_principle", "none").lower() != "none" and truth.get("confidence", 0) > thr["truth"]:
-        outcome = "allowed_with_mitigations"
-        mitigations.append(lib["truth"]["conflict"])
-        conflicts.append("truth")
-    elif prag.get("confidence", 1) < thr["pragmatics"]:
-        outcome = "needs_clarification"
-        mitigations.append(lib["pragmatics"]["conflict"])
-        conflicts.append("pragmatics")
-
-    critic_breakdown = {
-        name: CriticBreakdown(
+    decision_rules, prag_threshold, prag_mitigation = _decision_rules()
+
+    for critic, rule_outcome, threshold, mitigation in decision_rules:
+        vals = results.get(critic, {})
+        if vals.get("constitutional_principle", "none").lower() != "none" and vals.get("confidence", 0) > threshold:
+            outcome = rule_outcome
+            mitigations.append(mitigation)
+            conflicts.append(critic)
+            break
+    else:
+        if results.get("pragmatics", {}).get("confidence", 1) < prag_threshold:
+            outcome = "needs_clarification"
+            mitigations.append(prag_mitigation)
+            conflicts.append("pragmatics")
+
+    # Breakdown and mean confidence in one pass over the results.
+    critic_breakdown = {}
+    total = 0
+    for name, vals in results.items():
+        conf = vals.get("confidence", 0.0)
+        critic_breakdown[name] = CriticBreakdown(
             summary=vals.get("claim", ""),
             details=[vals.get("evidence", ""), vals.get("constitutional_principle", ""), vals.get("mitigation", "")],
-            confidence=vals.get("confidence", 0.0),
+            confidence=conf,
         )
-        for name, vals in results.items()
-    }
-
-    confidence = sum(v.get("confidence", 0) for v in results.values()) / max(len(results), 1)
+        total += conf
+    confidence = total / max(len(results), 1)
 
-    severity = "medium"
-    if outcome == "blocked":
-        severity = "high"
-    elif outcome in ("needs_clarification", "allowed_with_mitigations"):
-        severity = "medium"
-    else:
-        severity = "low"
+    severity = _SEVERITY_BY_OUTCOME.get(outcome, "low")
 
     return FinalDecision(
         outcome=outcome,
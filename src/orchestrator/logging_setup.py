@@ -1,19 +1,27 @@
 import logging
 import sys
-import json
 import time
+import orjson
 
 class JsonFormatter(logging.Formatter):
+    # Timestamps have one-second resolution, so format each second once.
+    _last_ts_int = -1
+    _last_ts_str = ""
+
     def format(self, record):
+        ts_int = int(record.created)
+        if ts_int != self._last_ts_int:
+            self._last_ts_str = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts_int))
+            self._last_ts_int = ts_int
         payload = {
-            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(record.created)),
+            "timestamp": self._last_ts_str,
             "level": record.levelname,
             "message": record.getMessage(),
             "name": record.name,
         }
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(payload)
+        return orjson.dumps(payload).decode()
 
 def configure_logging(level=logging.INFO):
     handler = logging.StreamHandler(sys.stdout)
@@ -1,93 +1,359 @@
+import asyncio
 import json
+import logging
 import os
+import re
+import threading
+import unicodedata
 import time
-from typing import Dict, Any, List, Optional
+from itertools import islice
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from .schemas import PrecedentRecord
-from .db import store_precedent_db, read_precedents_db, get_precedent_db, query_precedents_db
+from .db import store_precedents_db, read_precedents_db, get_precedent_db, query_precedents_db
+
+logger = logging.getLogger("eleanor.precedent")
 
 PRECEDENT_FILE = os.getenv("ELEANOR_PRECEDENT_FILE", "precedents.jsonl")
 CHAIN_WEBHOOK = os.getenv("ELEANOR_CHAIN_WEBHOOK")  # optional: POST precedent to a blockchain gateway
 JSONL_FALLBACK = os.getenv("ELEANOR_JSONL_FALLBACK", "true").lower() == "true"
+PRECEDENT_QUEUE_SIZE = 10000
+PRECEDENT_BATCH_SIZE = 256
+JSONL_BUFFER_BYTES = 65536
+WEBHOOK_CONCURRENCY = 16
+
+
+class _WriterState:
+    """
+    Write-behind state for one event loop: store_precedent only enqueues
+    and one writer task persists batches, so the deliberation path never
+    waits on disk or network. asyncio queues bind to the loop that first
+    waits on them, so the state is rebuilt when the running loop changes
+    (app restarts under TestClient, successive asyncio.run() calls).
+    """
+    __slots__ = ("loop", "queue", "task", "http_client", "webhook_sem", "webhook_tasks")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        # Items are (record, created_at); None stops the writer.
+        self.queue: "asyncio.Queue[Optional[Tuple[Dict[str, Any], str]]]" = asyncio.Queue(
+            maxsize=PRECEDENT_QUEUE_SIZE
+        )
+        self.task: Optional[asyncio.Task] = None
+        # Shared keep-alive client for CHAIN_WEBHOOK, its concurrency gate
+        # and the posts still in flight; all loop-bound, created on demand.
+        self.http_client = None
+        self.webhook_sem: Optional[asyncio.Semaphore] = None
+        self.webhook_tasks: set = set()
+
+
+_writer: Optional[_WriterState] = None
+
+# Append handle kept open for the writer's lifetime; only the writer task
+# (via to_thread, one batch at a time) touches it.
+_jsonl_fp = None
+
+
+_file_ready = False
 
 
 def _ensure_file():
+    # PRECEDENT_FILE is fixed at import, so the directory/file check only
+    # needs to run once; append mode recreates the file if it is removed.
+    global _file_ready
+    if _file_ready:
+        return
     os.makedirs(os.path.dirname(PRECEDENT_FILE) or ".", exist_ok=True)
     if not os.path.exists(PRECEDENT_FILE):
         with open(PRECEDENT_FILE, "w", encoding="utf-8"):
             pass
+    _file_ready = True
+
+
+def _get_writer() -> _WriterState:
+    global _writer
+    loop = asyncio.get_running_loop()
+    state = _writer
+    if state is None or state.loop is not loop:
+        state = _writer = _WriterState(loop)
+    if state.task is None or state.task.done():
+        state.task = loop.create_task(_writer_loop(state))
+    return state
 
 
-def store_precedent(record: Dict[str, Any]) -> str:
-    """Append a precedent record to a JSONL file and return the generated ID."""
+async def store_precedent(record: Dict[str, Any]) -> str:
+    """Queue a precedent record for persistence and return its ID."""
     case_id = record.get("precedentId") or f"EC-{int(time.time())}"
     record["precedentId"] = case_id
-    if JSONL_FALLBACK:
+    # Stamped here so each record keeps its own time however it is batched.
+    created_at = datetime.utcnow().isoformat() + "Z"
+    await _get_writer().queue.put((record, created_at))
+    return case_id
+
+
+async def flush_precedents():
+    """Persist everything queued on the running loop and stop the writer."""
+    state = _writer
+    if state is None or state.loop is not asyncio.get_running_loop():
+        return
+    if state.task is None or state.task.done():
+        return
+    await state.queue.put(None)
+    await asyncio.gather(state.task, return_exceptions=True)
+    state.task = None
+    await asyncio.to_thread(_close_jsonl)
+    await _close_webhook(state)
+
+
+def _append_jsonl(batch: List[Dict[str, Any]], flush: bool):
+    global _jsonl_fp
+    if _jsonl_fp is None:
         _ensure_file()
-        with open(PRECEDENT_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
-    # Also persist to sqlite db (best effort)
+        _jsonl_fp = open(PRECEDENT_FILE, "a", encoding="utf-8", buffering=JSONL_BUFFER_BYTES)
+    _jsonl_fp.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in batch))
+    if flush:
+        _jsonl_fp.flush()
+
+
+def _close_jsonl():
+    global _jsonl_fp
+    if _jsonl_fp is not None:
+        fp, _jsonl_fp = _jsonl_fp, None
+        fp.close()
+
+
+def _get_http_client(state: _WriterState):
+    if state.http_client is None:
+        import httpx
+        state.http_client = httpx.AsyncClient(timeout=5)
+        state.webhook_sem = asyncio.Semaphore(WEBHOOK_CONCURRENCY)
+    return state.http_client
+
+
+async def _post_one(state: _WriterState, record: Dict[str, Any]):
     try:
-        import asyncio
-        asyncio.run(store_precedent_db(record))
+        client = _get_http_client(state)
+        async with state.webhook_sem:
+            await client.post(CHAIN_WEBHOOK, json=record)
     except Exception:
+        # Best-effort; do not fail the main path
         pass
-    # Optional: forward to a blockchain gateway / webhook for immutable storage
-    if CHAIN_WEBHOOK:
+
+
+def _post_webhook(state: _WriterState, batch: List[Dict[str, Any]]):
+    # Posts run alongside the writer so a slow gateway never delays the
+    # next batch's local persistence.
+    for record in batch:
+        task = asyncio.create_task(_post_one(state, record))
+        state.webhook_tasks.add(task)
+        task.add_done_callback(state.webhook_tasks.discard)
+
+
+async def _close_webhook(state: _WriterState):
+    if state.webhook_tasks:
+        await asyncio.gather(*state.webhook_tasks, return_exceptions=True)
+    if state.http_client is not None:
+        client, state.http_client = state.http_client, None
+        state.webhook_sem = None
+        await client.aclose()
+
+
+async def _persist(state: _WriterState, batch: List[Dict[str, Any]], created_at: List[str], idle: bool):
+    if JSONL_FALLBACK:
         try:
-            import requests
-            requests.post(CHAIN_WEBHOOK, json=record, timeout=5)
+            # Flush once the queue is idle; under load the buffer batches writes.
+            await asyncio.to_thread(_append_jsonl, batch, idle)
         except Exception:
-            # Best-effort; do not fail the main path
-            pass
-    return case_id
+            logger.exception("precedent JSONL append failed")
+    # Also persist to sqlite db (best effort)
+    try:
+        await store_precedents_db(batch, created_at)
+    except Exception:
+        logger.exception("precedent DB insert failed")
+    # Optional: forward to a blockchain gateway / webhook for immutable storage
+    if CHAIN_WEBHOOK:
+        _post_webhook(state, batch)
+
+
+async def _writer_loop(state: _WriterState):
+    q = state.queue
+    stop = False
+    while not stop:
+        batch: List[Dict[str, Any]] = []
+        created_at: List[str] = []
+        item = await q.get()
+        while True:
+            if item is None:
+                stop = True
+                break
+            batch.append(item[0])
+            created_at.append(item[1])
+            if len(batch) >= PRECEDENT_BATCH_SIZE:
+                break
+            try:
+                item = q.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+        if batch:
+            await _persist(state, batch, created_at, q.empty())
 
 
-def read_precedents() -> List[PrecedentRecord]:
+async def read_precedents() -> List[PrecedentRecord]:
     try:
         # prefer DB if available
-        import asyncio
-        rows = asyncio.run(read_precedents_db())
+        rows = await read_precedents_db()
         return [PrecedentRecord(**r) for r in rows]
     except Exception:
         pass
     if not JSONL_FALLBACK:
         return []
+    return await asyncio.to_thread(_read_jsonl)
+
+
+def iter_precedents() -> Iterator[PrecedentRecord]:
+    """Yield JSONL precedents one at a time so callers can stop early."""
     _ensure_file()
-    records: List[PrecedentRecord] = []
-    with open(PRECEDENT_FILE, "r", encoding="utf-8") as f:
+    try:
+        f = open(PRECEDENT_FILE, "r", encoding="utf-8", buffering=JSONL_BUFFER_BYTES)
+    except FileNotFoundError:
+        return
+    with f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
                 data = json.loads(line)
-                records.append(PrecedentRecord(**data))
+                yield PrecedentRecord(**data)
             except Exception:
                 continue
-    return records
-
-
-def get_precedent(precedent_id: str) -> Optional[PrecedentRecord]:
-    for rec in read_precedents():
-        if rec.precedentId == precedent_id:
-            return rec
-    return None
-
-
-def query_precedents(text_query: Optional[str] = None, tag: Optional[str] = None, severity: Optional[str] = None, flag: Optional[str] = None) -> List[PrecedentRecord]:
-    records = read_precedents()
-    if text_query:
-        q = text_query.lower()
-        records = [
-            rec for rec in records
-            if q in (rec.input or "").lower()
-            or q in (rec.outcome or "").lower()
-            or any(q in (tag.lower()) for tag in (rec.tags or []))
-        ]
-    if tag:
-        records = [rec for rec in records if any(tag.lower() == t.lower() for t in (rec.tags or []))]
-    if severity:
-        records = [rec for rec in records if rec.severity.lower() == severity.lower()]
-    if flag:
-        records = [rec for rec in records if flag.lower() in [f.lower() for f in (rec.flags or [])]]
-    return records
+
+
+def _read_jsonl() -> List[PrecedentRecord]:
+    return list(iter_precedents())
+
+
+# precedentId -> byte offset of its first JSONL line, extended incrementally
+# as the file grows so each lookup only parses lines it has not seen.
+_jsonl_index: Dict[str, int] = {}
+_jsonl_indexed_to = 0
+_jsonl_lock = threading.Lock()
+
+
+def _index_jsonl(f):
+    global _jsonl_indexed_to
+    f.seek(0, os.SEEK_END)
+    if f.tell() < _jsonl_indexed_to:
+        # File was truncated or replaced; start over.
+        _jsonl_index.clear()
+        _jsonl_indexed_to = 0
+    f.seek(_jsonl_indexed_to)
+    offset = _jsonl_indexed_to
+    for line in f:
+        if not line.endswith(b"\n"):
+            break  # partial write in progress
+        try:
+            pid = json.loads(line).get("precedentId")
+        except Exception:
+            pid = None
+        if pid:
+            _jsonl_index.setdefault(pid, offset)
+        offset += len(line)
+    _jsonl_indexed_to = offset
+
+
+def _get_precedent_jsonl(precedent_id: str) -> Optional[PrecedentRecord]:
+    try:
+        f = open(PRECEDENT_FILE, "rb")
+    except FileNotFoundError:
+        return None
+    # Lookups run in worker threads; the index is shared state.
+    with f, _jsonl_lock:
+        if precedent_id not in _jsonl_index:
+            _index_jsonl(f)
+        offset = _jsonl_index.get(precedent_id)
+        if offset is None:
+            return None
+        f.seek(offset)
+        try:
+            return PrecedentRecord(**json.loads(f.readline()))
+        except Exception:
+            return None
+
+
+async def get_precedent(precedent_id: str) -> Optional[PrecedentRecord]:
+    try:
+        # prefer DB if available (primary key lookup)
+        row = await get_precedent_db(precedent_id)
+        if row:
+            return PrecedentRecord(**row)
+    except Exception:
+        pass
+    if not JSONL_FALLBACK:
+        return None
+    return await asyncio.to_thread(_get_precedent_jsonl, precedent_id)
+
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def _fts_tokens(text: str) -> List[str]:
+    # Mirrors the FTS5 unicode61 tokenizer: case-folded, diacritics removed,
+    # split on anything that is not a letter or digit.
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _TOKEN_RE.findall(stripped)
+
+
+def _phrase_matches(tokens: List[str], text: Optional[str]) -> bool:
+    # Same semantics as db._fts_phrase: the query tokens appear consecutively
+    # and the last one only needs to be a prefix.
+    words = _fts_tokens(text or "")
+    *head, last = tokens
+    n = len(head)
+    for i in range(len(words) - n):
+        if words[i:i + n] == head and words[i + n].startswith(last):
+            return True
+    return False
+
+
+def _matches(rec: PrecedentRecord, q: Optional[List[str]], tag: Optional[str], severity: Optional[str], flag: Optional[str]) -> bool:
+    # Filter arguments arrive lower-cased, the text query as FTS tokens.
+    if q is not None and not (_phrase_matches(q, rec.input) or _phrase_matches(q, rec.outcome)):
+        return False
+    if tag and not any(tag == t.lower() for t in (rec.tags or [])):
+        return False
+    if severity and rec.severity.lower() != severity:
+        return False
+    if flag and flag not in [f.lower() for f in (rec.flags or [])]:
+        return False
+    return True
+
+
+def _query_jsonl(text_query, tag, severity, flag, sort, limit) -> List[PrecedentRecord]:
+    tag, severity, flag = (v.lower() if v else v for v in (tag, severity, flag))
+    q = _fts_tokens(text_query) if text_query else None
+    if q == []:
+        # Punctuation-only queries have no tokens and match nothing in FTS5.
+        return []
+    matched = (rec for rec in iter_precedents() if _matches(rec, q, tag, severity, flag))
+    limit = limit if isinstance(limit, int) and limit > 0 else None
+    if sort in ("newest", "oldest"):
+        records = sorted(matched, key=lambda r: r.timestamp, reverse=sort == "newest")
+        return records[:limit]
+    # Unsorted: stop reading as soon as `limit` records match.
+    return list(islice(matched, limit))
+
+
+async def query_precedents(text_query: Optional[str] = None, tag: Optional[str] = None, severity: Optional[str] = None, flag: Optional[str] = None, sort: Optional[str] = None, limit: Optional[int] = None) -> List[PrecedentRecord]:
+    if text_query is not None and not isinstance(text_query, str):
+        raise TypeError(f"text_query must be a string, got {type(text_query).__name__}")
+    try:
+        # Filters, ordering and limit are all evaluated by SQLite.
+        rows = await query_precedents_db(text_query, tag=tag, severity=severity, flag=flag, sort=sort or "newest", limit=limit)
+        return [PrecedentRecord(**r) for r in rows]
+    except Exception:
+        pass
+    if not JSONL_FALLBACK:
+        return []
+    return await asyncio.to_thread(_query_jsonl, text_query, tag, severity, flag, sort, limit)
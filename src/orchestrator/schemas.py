@@ -1,5 +1,5 @@
 from typing import List, Dict, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import time
 
 
@@ -13,7 +13,7 @@ class DeliberationEvent(BaseModel):
     critic: str
     message: str
     confidence: float
-    timestamp: float = time.time()
+    timestamp: float = Field(default_factory=time.time)
 
 
 class ConflictEvent(BaseModel):
@@ -21,7 +21,7 @@ class ConflictEvent(BaseModel):
     critic: str
     severity: str
     message: str
-    timestamp: float = time.time()
+    timestamp: float = Field(default_factory=time.time)
 
 
 class CriticBreakdown(BaseModel):
@@ -1,5 +1,102 @@
-import json
+import asyncio
+from typing import Any, List
+import orjson
 from fastapi import WebSocket
+from pydantic import BaseModel
 
-async def emit(ws: WebSocket, payload: dict):
-    await ws.send_text(json.dumps(payload, default=str))
+WS_MAX_BATCH = 32
+WS_QUEUE_SIZE = 8 * WS_MAX_BATCH
+
+_CLOSE = object()
+
+
+class WsBatcher:
+    """
+    Coalesces outgoing deliberation messages into fewer WebSocket sends.
+
+    Producers enqueue payloads; a single writer task drains whatever is
+    pending (up to WS_MAX_BATCH) per send. A lone message goes out unchanged;
+    several are wrapped as {"type": "batch", "events": [...]}. The queue is
+    bounded, so producers wait for a slow client instead of buffering
+    without limit.
+    """
+
+    def __init__(self, ws: WebSocket, max_batch: int = WS_MAX_BATCH, max_queue: int = WS_QUEUE_SIZE):
+        self._ws = ws
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task = asyncio.create_task(self._writer())
+
+    async def put(self, payload: dict):
+        if not await self._enqueue(payload):
+            # Surface send failures (e.g. client gone) to the producer.
+            self._task.result()
+            raise RuntimeError("WebSocket writer closed")
+
+    async def aclose(self):
+        """Flush pending messages and stop the writer."""
+        await self._enqueue(_CLOSE)
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _enqueue(self, item) -> bool:
+        """Queue `item`; False if the writer is gone and never will read it."""
+        if self._task.done():
+            return False
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            pass
+        # Wait for a free slot, but stop waiting if the writer dies while
+        # the queue is full: nothing would ever make room again.
+        putter = asyncio.ensure_future(self._queue.put(item))
+        try:
+            await asyncio.wait((putter, self._task), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not putter.done():
+                putter.cancel()
+        return not putter.cancelled()
+
+    async def _writer(self):
+        q = self._queue
+        while True:
+            item = await q.get()
+            if item is _CLOSE:
+                return
+            batch: List[dict] = [item]
+            closing = False
+            while len(batch) < self._max_batch:
+                try:
+                    item = q.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is _CLOSE:
+                    closing = True
+                    break
+                batch.append(item)
+            await self._send(batch)
+            if closing:
+                return
+
+    async def _send(self, batch: List[dict]):
+        if len(batch) == 1:
+            await ws_send_json(self._ws, batch[0])
+        else:
+            await ws_send_json(self._ws, {"type": "batch", "events": batch})
+
+
+def _json_default(obj: Any):
+    # Models are serialised by the writer, not converted by producers.
+    if isinstance(obj, BaseModel):
+        return obj.dict()
+    return str(obj)
+
+
+async def ws_send_json(ws: WebSocket, obj: Any):
+    # Text frames (not bytes) so browser clients keep receiving strings.
+    await ws.send_text(orjson.dumps(obj, default=_json_default).decode())
+
+
+async def emit(stream: WsBatcher, payload: Any):
+    """Queue a dict or pydantic model for the WebSocket writer."""
+    await stream.put(payload)
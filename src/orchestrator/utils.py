@@ -1,25 +1,49 @@
-from typing import Optional
+import atexit
+import math
+import os
+import re
+import sys
+import threading
+import time
+from functools import lru_cache
+from typing import Final, Optional
 
 try:
     import pynvml
 except ImportError:
     pynvml = None
 
-UNCERTAINTY_TERMS = {
+# Builds without the utilization query are treated as no NVML, checked
+# once here rather than on every reading.
+if pynvml is not None and not hasattr(pynvml, "nvmlDeviceGetUtilizationRates"):
+    pynvml = None
+
+
+def _gpus_hidden() -> bool:
+    cuda = os.environ.get("CUDA_VISIBLE_DEVICES")
+    nvidia = os.environ.get("NVIDIA_VISIBLE_DEVICES")
+    return ((cuda is not None and cuda.strip() in ("", "-1"))
+            or (nvidia is not None and nvidia.strip().lower() in ("", "void", "none")))
+
+
+# CPU-only deployments that hide all GPUs never touch NVML.
+if pynvml is not None and _gpus_hidden():
+    pynvml = None
+
+UNCERTAINTY_TERMS = frozenset(map(sys.intern, {
     "uncertain", "not sure", "unknown", "unclear", "ambiguous",
     "may", "might", "could", "possibly", "perhaps"
-}
+}))
 
-LOW_CONFIDENCE_MARKERS = {
+LOW_CONFIDENCE_MARKERS = frozenset(map(sys.intern, {
     "not confident", "low confidence", "guess", "speculative", "estimate"
-}
+}))
 
 def confidence_from_logprobs(logprobs) -> float:
     """
     Convert a list of logprobs (natural log) to a rough confidence score.
     Uses mean logprob exponentiated, clipped to [0,1].
     """
-    import math
     if not logprobs:
         return 0.0
     try:
@@ -30,28 +54,128 @@ def confidence_from_logprobs(logprobs) -> float:
         return 0.0
 
 
+def confidences_from_logprobs_batch(batches) -> list:
+    """
+    confidence_from_logprobs for many completions at once; each entry
+    scores the same as a separate call.
+    """
+    exp = math.exp
+    out = []
+    for logprobs in batches:
+        if not logprobs:
+            out.append(0.0)
+            continue
+        try:
+            # exp() is never negative, so only the upper clip is needed.
+            out.append(min(0.99, exp(sum(logprobs) / len(logprobs))))
+        except Exception:
+            out.append(0.0)
+    return out
+
+
 def normalize_text(t: str) -> str:
     return t.strip()
 
 
-def gpu_utilization() -> Optional[int]:
+def normalize_texts(ts) -> list:
+    """Batch normalize_text; the C strip is called without per-item dispatch."""
+    return list(map(str.strip, ts))
+
+
+# Readings are reused for this long (seconds) so frequent callers do not
+# hit NVML on every call.
+GPU_UTIL_TTL = 0.1
+
+
+class _NvmlManager:
     """
-    Return GPU utilization percent if NVML is available; otherwise None.
+    Process-wide NVML state. nvmlInit runs once, under a lock so
+    concurrent workers never race on it, and the device handles are
+    reused; a failed probe is remembered (no handles) rather than
+    retried, so hosts without a driver raise only once. Readings are
+    queried outside the lock.
     """
-    if not pynvml:
-        return None
-    try:
-        pynvml.nvmlInit()
-        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-        util = pynvml.nvmlDeviceGetUtilizationRates(handle)
-        return int(util.gpu)
-        except Exception:
-            return None
-    finally:
+    __slots__ = ("_lock", "_inited", "_handles", "_last_ts", "_last_val")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inited = False
+        self._handles = ()
+        self._last_ts = float("-inf")
+        self._last_val: Optional[int] = None
+
+    def _probe(self):
         try:
+            pynvml.nvmlInit()
+        except pynvml.NVMLError:
+            return ()
+        try:
+            count = pynvml.nvmlDeviceGetCount()
+            handles = tuple(pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(count))
+        except pynvml.NVMLError:
             pynvml.nvmlShutdown()
-        except Exception:
-            pass
+            return ()
+        atexit.register(pynvml.nvmlShutdown)
+        return handles
+
+    def _ensure_initialized(self):
+        if self._inited:
+            return self._handles
+        with self._lock:
+            if not self._inited:
+                self._handles = self._probe()
+                self._inited = True
+        return self._handles
+
+    def utilization_percent(self) -> Optional[int]:
+        if not pynvml:
+            return None
+        now = time.monotonic()
+        if now - self._last_ts < GPU_UTIL_TTL:
+            return self._last_val
+        handles = self._ensure_initialized()
+        if not handles:
+            return None
+        try:
+            val = max(int(pynvml.nvmlDeviceGetUtilizationRates(h).gpu) for h in handles)
+        except pynvml.NVMLError:
+            val = None
+        self._last_ts, self._last_val = now, val
+        return val
+
+
+_nvml = _NvmlManager()
+
+
+def gpu_utilization() -> Optional[int]:
+    """
+    Return the highest utilization percent across GPUs if NVML is
+    available; otherwise None.
+    """
+    return _nvml.utilization_percent()
+
+
+# Substring tests against a lowered copy. str.__contains__ is a C fast
+# search and beats both one big re alternation (sre tries the whole
+# alternation at every position, far slower still with IGNORECASE) and
+# token-set lookups, which would also stop matching inside words.
+_TERMS = tuple(sorted(UNCERTAINTY_TERMS | LOW_CONFIDENCE_MARKERS))
+_MIN_TERM_LEN = min(map(len, _TERMS))
+_MAX_TERM_LEN = max(map(len, _TERMS))
+
+# The length bonus saturates at 0.15 from 750 chars, so it is looked up
+# by length instead of recomputed. The table holds the exact values the
+# min(n / 500.0 * 0.1, 0.15) formula gives.
+_LENGTH_BONUS_MAX = 0.15
+_LENGTH_BONUS = tuple(min(n / 500.0 * 0.1, _LENGTH_BONUS_MAX) for n in range(750))
+
+
+def _length_bonus(n: int) -> float:
+    return _LENGTH_BONUS[n] if n < 750 else _LENGTH_BONUS_MAX
+
+
+def _find_terms(lowered: str) -> set:
+    return {term for term in _TERMS if term in lowered}
 
 
 def heuristic_confidence_from_text(text: str, base: float = 0.1) -> float:
@@ -60,24 +184,77 @@ def heuristic_confidence_from_text(text: str, base: float = 0.1) -> float:
     - Penalize uncertainty terms.
     - Reward longer, coherent text modestly.
     - Penalize explicit low-confidence markers.
+
+    Only the first MAX_INPUT_CHARS characters are scanned for terms, so
+    the cost per call is bounded however long the text is.
     """
-    lowered = text.lower()
-    penalty = sum(1 for term in UNCERTAINTY_TERMS if term in lowered) * 0.05
-    penalty += sum(1 for term in LOW_CONFIDENCE_MARKERS if term in lowered) * 0.07
-    length_bonus = min(len(text) / 500.0 * 0.1, 0.15)
+    # The length bonus saturates, so the capped length plus the scanned
+    # prefix identify the score; the cache never holds more than that.
+    return _heuristic_confidence(text[:MAX_INPUT_CHARS], min(len(text), len(_LENGTH_BONUS)), base)
+
+
+# Retries and critic fan-out score the same text repeatedly.
+@lru_cache(maxsize=4096)
+def _heuristic_confidence(head: str, length: int, base: float) -> float:
+    if length < _MIN_TERM_LEN:
+        # Too short to contain any term; only the length bonus applies.
+        return max(0.0, min(0.9, base + _LENGTH_BONUS[length]))
+    found = _find_terms(head.lower())
+    penalty = len(found & UNCERTAINTY_TERMS) * 0.05
+    penalty += len(found & LOW_CONFIDENCE_MARKERS) * 0.07
+    length_bonus = _length_bonus(length)
     conf = max(0.0, min(0.9, base + length_bonus - penalty))
     return conf
 
 
+class StreamingConfidence:
+    """
+    Incremental heuristic_confidence_from_text for streamed replies.
+
+    feed(chunk) returns the same score heuristic_confidence_from_text
+    would give for everything fed so far, but only scans the new chunk
+    plus a short overlap so terms split across chunks are still found.
+    """
+    __slots__ = ("base", "_length", "_tail", "_uncertain", "_low")
+
+    def __init__(self, base: float = 0.1):
+        self.base = base
+        self._length = 0
+        self._tail = ""
+        self._uncertain: set = set()
+        self._low: set = set()
+
+    def feed(self, chunk: str) -> float:
+        remaining = MAX_INPUT_CHARS - self._length
+        if remaining > 0:
+            window = self._tail + chunk[:remaining].lower()
+            found = _find_terms(window)
+            self._uncertain |= found & UNCERTAINTY_TERMS
+            self._low |= found & LOW_CONFIDENCE_MARKERS
+            self._tail = window[-(_MAX_TERM_LEN - 1):]
+        self._length += len(chunk)
+        penalty = len(self._uncertain) * 0.05
+        penalty += len(self._low) * 0.07
+        length_bonus = _length_bonus(self._length)
+        return max(0.0, min(0.9, self.base + length_bonus - penalty))
+
+
 # UNESCO/UDHR-aligned helper sets for rapid heuristic checks
-PROTECTED_CLASSES = {
+PROTECTED_CLASSES = frozenset(map(sys.intern, {
     "race", "ethnicity", "gender", "sex", "sexual orientation", "religion", "faith",
     "disability", "age", "nationality", "origin", "immigration", "pregnancy", "veteran"
-}
+}))
+
+# One alternation scan instead of a substring search per term. Longest
+# terms first so "sexual orientation" is preferred over "sex".
+PROTECTED_CLASSES_RE = re.compile(
+    "|".join(re.escape(t) for t in sorted(PROTECTED_CLASSES, key=len, reverse=True)),
+    re.IGNORECASE,
+)
 
-SENSITIVE_TOPICS = {
+SENSITIVE_TOPICS = frozenset(map(sys.intern, {
     "health", "biometric", "genetic", "financial", "political", "union", "religious"
-}
+}))
 
 # Body size limits (could also be enforced at proxy)
-MAX_INPUT_CHARS = int(os.getenv("ELEANOR_MAX_INPUT", "8000"))
+MAX_INPUT_CHARS: Final[int] = int(os.environ.get("ELEANOR_MAX_INPUT", "8000"))